@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
@@ -18,6 +19,24 @@ class Frame:
     location_gradient: Optional[Tuple[int, int, int, int, int, int]] = None
 
 
+def _copy_two_levels(value):
+    if isinstance(value, dict):
+        return {key: item.copy() if isinstance(item, (dict, list)) else item for key, item in value.items()}
+    return [item.copy() if isinstance(item, (dict, list)) else item for item in value]
+
+
+def _snapshot(obj):
+    # Frozen view for transition frames: containers (and the dicts/lists
+    # inside them, e.g. gear entries and followers) are copied, but
+    # without deepcopy's memo/reduce walk over the whole object graph.
+    clone = copy.copy(obj)
+    attrs = clone.__dict__
+    for key, value in attrs.items():
+        if isinstance(value, (dict, list)):
+            attrs[key] = _copy_two_levels(value)
+    return clone
+
+
 @dataclass
 class Player:
     name: str
@@ -51,8 +70,11 @@ class Player:
     temp_evasion_bonus: int = 0
     flags: dict = field(default_factory=dict)
     quests: dict = field(default_factory=dict)
+    inventory_revision: int = 0
 
     def __setattr__(self, name, value):
+        if name == "gear_inventory":
+            super().__setattr__("inventory_revision", getattr(self, "inventory_revision", 0) + 1)
         if name in ("temp_atk_bonus", "temp_def_bonus"):
             try:
                 current = getattr(self, name)
@@ -164,12 +186,16 @@ class Player:
             quests=quests,
         )
 
+    def snapshot(self) -> "Player":
+        return _snapshot(self)
+
     def add_item(self, key: str, amount: int = 1):
         self.inventory[key] = int(self.inventory.get(key, 0)) + amount
 
     def add_gear(self, item_id: str, items_data, *, auto_equip: bool = True) -> dict:
         gear = self._create_gear_instance(item_id, items_data)
         self.gear_inventory.append(gear)
+        self.inventory_revision += 1
         if auto_equip:
             self.auto_equip_if_best(gear.get("id"))
         return gear
@@ -777,6 +803,7 @@ class Player:
                 self.gear_inventory.append(gear)
                 cleaned[slot] = gear.get("id")
         self.equipment = cleaned
+        self.inventory_revision += 1
 
     def _slot_data(self):
         return getattr(self, "_equipment_slots", None)
@@ -1113,6 +1140,7 @@ class Player:
                 if gear_id in {gear_a, gear_b}:
                     equip.pop(slot, None)
         self.gear_inventory.append(fused)
+        self.inventory_revision += 1
         self._recalc_gear()
         if auto_equip:
             self.auto_equip_if_best(fused.get("id"))
@@ -1249,3 +1277,6 @@ class Opponent:
     temp_def_bonus: int = 0
     poison_turns: int = 0
     poison_damage: int = 0
+
+    def snapshot(self) -> "Opponent":
+        return _snapshot(self)
@@ -1,5 +1,6 @@
 """Layout helpers for action panels and ANSI-safe text width."""
 
+import re
 from typing import Optional
 
 from app.commands.scene_commands import format_commands
@@ -7,10 +8,21 @@ from app.ui.ansi import ANSI
 from app.ui.constants import ACTION_LINES, SCREEN_WIDTH
 
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
 def strip_ansi(s: str) -> str:
     # Minimal ANSI stripping for accurate padding when we add colors inside lines.
-    import re
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    if "\x1b" not in s:
+        return s
+    return _ANSI_RE.sub("", s)
+
+
+def strip_ansi_lines(lines: list[str]) -> list[str]:
+    # One regex pass over the whole block instead of one per line.
+    if not lines:
+        return []
+    return _ANSI_RE.sub("", "\x00".join(lines)).split("\x00")
 
 
 def pad_or_trim_ansi(text: str, width: int) -> str:
@@ -164,15 +164,7 @@ class AudioManager:
     def _apply_volume(self, samples: array, volume: float) -> array:
         if volume >= 0.99:
             return samples
-        scaled = array("h")
-        for sample in samples:
-            value = int(sample * volume)
-            if value > 32767:
-                value = 32767
-            elif value < -32768:
-                value = -32768
-            scaled.append(value)
-        return scaled
+        return array("h", [int(max(-32768.0, min(32767.0, sample * volume))) for sample in samples])
 
     def play_sequence_once(self, name: str, root_note: str, scale: str | None = None, wave: str | None = None) -> None:
         if self._web is not None:
@@ -195,13 +187,14 @@ class AudioManager:
         sequences = self._data.get("sequences", {})
         if name not in sequences:
             return
-        sequence = dict(sequences[name])
-        if scale:
-            sequence["scale"] = scale
-        if wave or self._default_wave:
-            sequence["wave"] = wave or self._default_wave
         root_midi = music.parse_root(root_note)
-        samples = music.render_sequence(sequence, root_midi, self._data)
+        samples = music.render_sequence(
+            sequences[name],
+            root_midi,
+            self._data,
+            wave_override=wave or self._default_wave,
+            scale_override=scale,
+        )
         samples = self._apply_volume(samples, self._music_volume)
         self._stop_kind("music")
         with self._lock:
@@ -254,13 +247,14 @@ class AudioManager:
             return
         sequences = self._data.get("sequences", {})
         if name in sequences:
-            sequence = dict(sequences[name])
-            if scale:
-                sequence["scale"] = scale
-            if wave or self._default_wave:
-                sequence["wave"] = wave or self._default_wave
             root_midi = music.parse_root(root_note)
-            samples = music.render_sequence(sequence, root_midi, self._data)
+            samples = music.render_sequence(
+                sequences[name],
+                root_midi,
+                self._data,
+                wave_override=wave or self._default_wave,
+                scale_override=scale,
+            )
         else:
             songs = self._data.get("songs", {})
             if name not in songs:
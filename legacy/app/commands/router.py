@@ -877,6 +877,7 @@ def _handle_title(command_id: str, state: CommandState, ctx: RouterContext, key:
         pending_slot = getattr(state.player, "title_pending_slot", None)
         if pending_slot:
             ctx.save_data.delete(pending_slot)
+            state.player.has_save = ctx.save_data.exists()
         state.player.title_confirm = False
         state.player.title_player_select = True
         state.player.title_player_cursor = 0
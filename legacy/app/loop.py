@@ -115,6 +115,51 @@ def _status_message(state: GameState, message: Optional[str]) -> str:
     return state.last_message
 
 
+def frame_from_state(ctx, state: GameState, generate_frame, message: str, **kwargs) -> Frame:
+    return generate_frame(
+        ctx.screen_ctx,
+        state.player,
+        state.opponents,
+        message,
+        state.leveling_mode,
+        state.shop_mode,
+        state.shop_view,
+        state.inventory_mode,
+        state.inventory_items,
+        state.hall_mode,
+        state.hall_view,
+        state.inn_mode,
+        state.stats_mode,
+        state.followers_mode,
+        state.spell_mode,
+        state.element_mode,
+        state.alchemist_mode,
+        state.alchemy_first,
+        state.alchemy_selecting,
+        state.temple_mode,
+        state.smithy_mode,
+        state.portal_mode,
+        state.quest_mode,
+        state.quest_detail_mode,
+        state.title_menu_stack,
+        state.options_mode,
+        state.action_cursor,
+        state.menu_cursor,
+        state.followers_focus,
+        state.followers_action_cursor,
+        state.spell_cast_rank,
+        state.spell_target_mode,
+        state.spell_target_cursor,
+        state.spell_target_command,
+        state.quest_continent_index,
+        state.quest_detail_id,
+        state.quest_detail_page,
+        state.level_cursor,
+        state.level_up_notes,
+        **kwargs,
+    )
+
+
 def render_frame_state(ctx, render_frame, state: GameState, generate_frame, message: Optional[str] = None, suppress_actions: bool = False) -> None:
     if hasattr(ctx, "audio"):
         audio_key = None
@@ -145,46 +190,11 @@ def render_frame_state(ctx, render_frame, state: GameState, generate_frame, mess
         if not audio_key:
             state.screen_audio_key = None
     def _build_frame(quest_effect: Optional[dict] = None, effect_frame: int = 0) -> Frame:
-        return generate_frame(
-            ctx.screen_ctx,
-            state.player,
-            state.opponents,
+        return frame_from_state(
+            ctx,
+            state,
+            generate_frame,
             _status_message(state, message),
-            state.leveling_mode,
-            state.shop_mode,
-            state.shop_view,
-            state.inventory_mode,
-            state.inventory_items,
-            state.hall_mode,
-            state.hall_view,
-            state.inn_mode,
-            state.stats_mode,
-            state.followers_mode,
-            state.spell_mode,
-            state.element_mode,
-            state.alchemist_mode,
-            state.alchemy_first,
-            state.alchemy_selecting,
-            state.temple_mode,
-            state.smithy_mode,
-            state.portal_mode,
-            state.quest_mode,
-            state.quest_detail_mode,
-            state.title_menu_stack,
-            state.options_mode,
-            state.action_cursor,
-            state.menu_cursor,
-            state.followers_focus,
-            state.followers_action_cursor,
-            state.spell_cast_rank,
-            state.spell_target_mode,
-            state.spell_target_cursor,
-            state.spell_target_command,
-            state.quest_continent_index,
-            state.quest_detail_id,
-            state.quest_detail_page,
-            state.level_cursor,
-            state.level_up_notes,
             suppress_actions=suppress_actions,
             quest_art_effect=quest_effect,
             quest_art_effect_frame=effect_frame,
@@ -1,6 +1,6 @@
 """Shop-related helpers for purchases."""
 
-from typing import Optional
+from typing import Optional, Sequence
 
 from app.data_access.items_data import ItemsData
 from app.models import Player
@@ -88,7 +88,14 @@ def shop_sell_inventory(player: Player, items_data: ItemsData) -> list[dict]:
     return entries
 
 
-def shop_commands(venue: dict, items_data: ItemsData, element: str, view: str, player: Optional[Player] = None) -> list[dict]:
+def shop_commands(
+    venue: dict,
+    items_data: ItemsData,
+    element: str,
+    view: str,
+    player: Optional[Player] = None,
+    inventory: Optional[Sequence[dict]] = None,
+) -> list[dict]:
     commands = []
     if view == "menu":
         commands = [
@@ -96,7 +103,8 @@ def shop_commands(venue: dict, items_data: ItemsData, element: str, view: str, p
             {"label": "Sell", "command": "SHOP_SELL"},
         ]
     elif view == "buy":
-        inventory = shop_inventory(venue, items_data, element)
+        if inventory is None:
+            inventory = shop_inventory(venue, items_data, element)
         for entry in inventory:
             price = int(entry.get("price", 0))
             commands.append({
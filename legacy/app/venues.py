@@ -1,6 +1,8 @@
 """Venue helpers for centralized venue behavior."""
 
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 import time
 from typing import Any, Optional
 
@@ -11,7 +13,78 @@ from app.ui.constants import SCREEN_WIDTH
 from app.ui.rendering import render_venue_art, render_venue_objects
 
 
-@dataclass
+_STATIC_GLYPHS = {
+    "w": f"{ANSI.FG_BLUE}~{ANSI.RESET}",
+    "o": f"{ANSI.FG_WHITE}o{ANSI.RESET}",
+    "|": f"{ANSI.FG_YELLOW}|{ANSI.RESET}",
+    "-": f"{ANSI.FG_YELLOW}-{ANSI.RESET}",
+    "/": f"{ANSI.FG_YELLOW}/{ANSI.RESET}",
+    "\\": f"{ANSI.FG_YELLOW}\\{ANSI.RESET}",
+}
+_ATLAS_TRANS = str.maketrans(_STATIC_GLYPHS)
+_ASCII_DIGITS = tuple(ord(ch) for ch in "0123456789")
+_FLICKER_STAR = f"{ANSI.FG_WHITE}{ANSI.DIM}*{ANSI.RESET}"
+_LOCKED_STAR = f"{ANSI.FG_WHITE}{ANSI.DIM}*{ANSI.RESET}"
+
+
+_ELEMENT_DIGIT = {
+    "base": "1",
+    "earth": "2",
+    "wind": "3",
+    "air": "3",
+    "fire": "4",
+    "water": "5",
+    "light": "6",
+    "lightning": "7",
+    "dark": "8",
+    "ice": "9",
+}
+_DIGIT_ELEMENT = {
+    "1": "base",
+    "2": "earth",
+    "3": "wind",
+    "4": "fire",
+    "5": "water",
+    "6": "light",
+    "7": "lightning",
+    "8": "dark",
+    "9": "ice",
+}
+
+_MODE_TO_VENUE = (
+    ("shop_mode", "town_shop"),
+    ("hall_mode", "town_hall"),
+    ("inn_mode", "town_inn"),
+    ("alchemist_mode", "town_alchemist"),
+    ("temple_mode", "town_temple"),
+    ("smithy_mode", "town_smithy"),
+    ("portal_mode", "town_portal"),
+)
+_VENUE_RESET = (
+    ("shop_mode", False),
+    ("shop_view", "menu"),
+    ("hall_mode", False),
+    ("inn_mode", False),
+    ("alchemist_mode", False),
+    ("alchemy_first", None),
+    ("alchemy_selecting", False),
+    ("temple_mode", False),
+    ("smithy_mode", False),
+    ("portal_mode", False),
+    ("current_venue_id", None),
+)
+_FLICKER_RATE = 1 / 0.35
+_FUSABLE_CACHE_SIZE = 32
+_FUSABLE_CACHE: dict[tuple, tuple[Any, list, list[dict]]] = {}
+_PORTAL_ATLAS_CACHE: dict[int, tuple[list[str], tuple[str, ...], int]] = {}
+_NARRATIVE_CACHE: dict[int, tuple[dict, tuple]] = {}
+_COMMANDS_CACHE: dict[int, tuple[dict, tuple[dict, ...]]] = {}
+_ATLAS_BLOCK_CACHE_SIZE = 32
+_ATLAS_BLOCK_CACHE: dict[tuple, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+_SHOP_INVENTORY_CACHE: dict[tuple, tuple[dict, tuple[dict, ...], dict[str, dict]]] = {}
+
+
+@dataclass(slots=True)
 class VenueRender:
     title: str
     body: list[str]
@@ -27,41 +100,80 @@ def _leave_action(label: str = "Leave") -> dict:
 
 
 def _append_leave(commands: list[dict]) -> list[dict]:
-    if not any(cmd.get("command") == "LEAVE" for cmd in commands):
+    if "LEAVE" not in {cmd.get("command") for cmd in commands}:
         commands.append(_leave_action())
     return commands
 
 
 def _fusable_gear(state: Any, first_id: Optional[str] = None) -> list[dict]:
-    gear_items = [g for g in state.player.gear_inventory if isinstance(g, dict)]
+    player = state.player
+    key = (
+        id(player),
+        id(player.gear_inventory),
+        len(player.gear_inventory),
+        getattr(player, "inventory_revision", None),
+        first_id,
+    )
+    cached = _FUSABLE_CACHE.get(key)
+    if cached and cached[0] is player and cached[1] is player.gear_inventory:
+        return list(cached[2])
+    # A replaced player can reuse a freed id (and revision), so the entry
+    # holds the objects themselves; entries for other players are dropped.
+    for stale in [k for k, entry in _FUSABLE_CACHE.items() if entry[0] is not player]:
+        del _FUSABLE_CACHE[stale]
+    if len(_FUSABLE_CACHE) >= _FUSABLE_CACHE_SIZE:
+        _FUSABLE_CACHE.clear()
+    gear = _scan_fusable_gear(state, first_id)
+    _FUSABLE_CACHE[key] = (player, player.gear_inventory, gear)
+    return list(gear)
+
+
+def _scan_fusable_gear(state: Any, first_id: Optional[str] = None) -> list[dict]:
+    by_slot: dict[str, list[dict]] = defaultdict(list)
+    slotted: list[tuple[str, dict]] = []
+    first = None
+    for gear in state.player.gear_inventory:
+        if not isinstance(gear, dict):
+            continue
+        if first_id and first is None and gear.get("id") == first_id:
+            first = gear
+        slot = str(gear.get("slot", "") or "")
+        if slot:
+            by_slot[slot].append(gear)
+            slotted.append((slot, gear))
     if first_id:
-        first = next((g for g in gear_items if g.get("id") == first_id), None)
         if not first:
             return []
-        slot = first.get("slot")
+        slot = str(first.get("slot", "") or "")
         if not slot:
             return []
-        return [g for g in gear_items if g.get("id") != first_id and g.get("slot") == slot]
-    slot_counts: dict[str, int] = {}
-    for gear in gear_items:
-        slot = str(gear.get("slot", "") or "")
-        if not slot:
-            continue
-        slot_counts[slot] = slot_counts.get(slot, 0) + 1
-    return [
-        g for g in gear_items
-        if slot_counts.get(str(g.get("slot", "") or ""), 0) >= 2
-    ]
+        return [g for g in by_slot[slot] if g.get("id") != first_id]
+    return [gear for slot, gear in slotted if len(by_slot[slot]) >= 2]
 
 
 def _truecolor(hex_code: str) -> str:
-    value = hex_code.lstrip("#")
+    if len(hex_code) == 7 and hex_code[0] == "#":
+        value = hex_code[1:]
+    else:
+        value = hex_code.lstrip("#")
+    return _truecolor_cached(value.lower())
+
+
+@lru_cache(maxsize=256)
+def _truecolor_cached(value: str) -> str:
     if len(value) != 6:
         return ""
     try:
-        r = int(value[0:2], 16)
-        g = int(value[2:4], 16)
-        b = int(value[4:6], 16)
+        if value.isalnum() and value[1] != "x":
+            rgb = int(value, 16)
+            r = (rgb >> 16) & 0xFF
+            g = (rgb >> 8) & 0xFF
+            b = rgb & 0xFF
+        else:
+            # Odd inputs (signs, spaces) keep the old per-channel parse.
+            r = int(value[0:2], 16)
+            g = int(value[2:4], 16)
+            b = int(value[4:6], 16)
     except ValueError:
         return ""
     return f"\033[38;2;{r};{g};{b}m"
@@ -72,8 +184,10 @@ def _color_code_for_key(colors: dict, key: str) -> str:
         return ""
     entry = colors.get(key)
     if isinstance(entry, dict):
-        hex_code = entry.get("hex", "") if isinstance(entry.get("hex"), str) else ""
-        name = entry.get("name", "") if isinstance(entry.get("name"), str) else ""
+        hex_value = entry.get("hex")
+        hex_code = hex_value if isinstance(hex_value, str) else ""
+        name_value = entry.get("name")
+        name = name_value if isinstance(name_value, str) else ""
     elif isinstance(entry, str):
         hex_code = ""
         name = entry
@@ -96,37 +210,121 @@ def _color_code_for_key(colors: dict, key: str) -> str:
     return ""
 
 
-def _colorize_atlas_line(
-    line: str,
+def _atlas_table(
     digit_colors: dict[str, str],
     flicker_digit: Optional[str],
     flicker_on: bool,
-    locked_color: str,
-) -> str:
+    locked_star: str,
+) -> dict[int, str]:
+    table = dict(_ATLAS_TRANS)
+    table.update(dict.fromkeys(_ASCII_DIGITS, locked_star))
+    table.update({ord(digit): f"{code}*{ANSI.RESET}" for digit, code in digit_colors.items()})
+    if flicker_digit and flicker_digit in digit_colors and not flicker_on:
+        table[ord(flicker_digit)] = _FLICKER_STAR
+    return table
+
+
+def _colorize_atlas_line(line: str, table: dict[int, str], locked_star: str) -> str:
     if not line:
         return line
-    out = []
-    for ch in line:
-        if ch in digit_colors:
-            if flicker_digit and ch == flicker_digit and not flicker_on:
-                out.append(f"{ANSI.FG_WHITE}{ANSI.DIM}*{ANSI.RESET}")
-            else:
-                out.append(f"{digit_colors[ch]}*{ANSI.RESET}")
-            continue
-        if ch.isdigit():
-            out.append(f"{locked_color}*{ANSI.RESET}")
-            continue
-        if ch == "w":
-            out.append(f"{ANSI.FG_BLUE}~{ANSI.RESET}")
-            continue
-        if ch == "o":
-            out.append(f"{ANSI.FG_WHITE}o{ANSI.RESET}")
-            continue
-        if ch in "|-/\\":
-            out.append(f"{ANSI.FG_YELLOW}{ch}{ANSI.RESET}")
-            continue
-        out.append(ch)
-    return "".join(out)
+    if not line.isascii():
+        extra = {ord(ch): locked_star for ch in set(line) if ch.isdigit() and ord(ch) not in table}
+        if extra:
+            table = {**table, **extra}
+    return line.translate(table)
+
+
+def _colorize_atlas_block(
+    lines: tuple[str, ...],
+    digit_colors: dict[str, str],
+    flicker_digit: Optional[str],
+    flicker_on: bool,
+) -> tuple[str, ...]:
+    if not lines:
+        return ()
+    flicker_off = bool(flicker_digit and flicker_digit in digit_colors and not flicker_on)
+    key = (id(lines), tuple(digit_colors.items()), flicker_digit if flicker_off else None)
+    cached = _ATLAS_BLOCK_CACHE.get(key)
+    if cached and cached[0] is lines:
+        return cached[1]
+    table = _atlas_table(digit_colors, flicker_digit, flicker_on, _LOCKED_STAR)
+    colored = tuple(_colorize_atlas_line("\n".join(lines), table, _LOCKED_STAR).split("\n"))
+    if len(_ATLAS_BLOCK_CACHE) >= _ATLAS_BLOCK_CACHE_SIZE:
+        _ATLAS_BLOCK_CACHE.clear()
+    _ATLAS_BLOCK_CACHE[key] = (lines, colored)
+    return colored
+
+
+@lru_cache(maxsize=64)
+def _greeting_lines(npcs: Any, npcs_version: int, npc_id: str) -> tuple[str, ...]:
+    return tuple(npcs.format_greeting(npc_id))
+
+
+def _portal_atlas(atlas_lines: list[str]) -> tuple[tuple[str, ...], int]:
+    if not atlas_lines:
+        return (), 0
+    cached = _PORTAL_ATLAS_CACHE.get(id(atlas_lines))
+    if cached and cached[0] is atlas_lines:
+        return cached[1], cached[2]
+    content_width = max(0, SCREEN_WIDTH - 2)
+    right_width = max((len(r) for r in atlas_lines), default=0)
+    right_width = min(right_width, 24)
+    right_width = min(right_width, max(0, content_width))
+    right_lines = tuple(
+        r[:right_width] if right_width and len(r) > right_width else r
+        for r in atlas_lines
+    )
+    _PORTAL_ATLAS_CACHE[id(atlas_lines)] = (atlas_lines, right_lines, right_width)
+    return right_lines, right_width
+
+
+def _venue_narrative(venue: dict) -> tuple:
+    if not venue:
+        return ()
+    cached = _NARRATIVE_CACHE.get(id(venue))
+    if cached and cached[0] is venue:
+        return cached[1]
+    narrative = tuple(venue.get("narrative", []))
+    _NARRATIVE_CACHE[id(venue)] = (venue, narrative)
+    return narrative
+
+
+def _venue_commands(venue: dict) -> tuple[dict, ...]:
+    if not venue:
+        return ()
+    cached = _COMMANDS_CACHE.get(id(venue))
+    if cached and cached[0] is venue:
+        return cached[1]
+    entries = venue.get("commands")
+    if isinstance(entries, list):
+        commands = tuple(entry for entry in entries if isinstance(entry, dict))
+    else:
+        commands = ()
+    _COMMANDS_CACHE[id(venue)] = (venue, commands)
+    return commands
+
+
+def _shop_entry(ctx: Any, venue: dict, element: str) -> tuple[dict, tuple[dict, ...], dict[str, dict]]:
+    key = (id(venue), element, id(ctx.items.all()))
+    cached = _SHOP_INVENTORY_CACHE.get(key)
+    if cached and cached[0] is venue:
+        return cached
+    inventory = tuple(shop_inventory(venue, ctx.items, element))
+    by_command: dict[str, dict] = {}
+    for entry in inventory:
+        by_command.setdefault(entry.get("command"), entry)
+    cached = (venue, inventory, by_command)
+    if venue:
+        _SHOP_INVENTORY_CACHE[key] = cached
+    return cached
+
+
+def _shop_inventory(ctx: Any, venue: dict, element: str) -> tuple[dict, ...]:
+    return _shop_entry(ctx, venue, element)[1]
+
+
+def _inventory_by_command(ctx: Any, venue: dict, element: str) -> dict[str, dict]:
+    return _shop_entry(ctx, venue, element)[2]
 
 
 def _highlight_label(label: str) -> str:
@@ -137,77 +335,69 @@ def _highlight_label(label: str) -> str:
 def venue_id_from_state(state: Any) -> Optional[str]:
     if getattr(state, "current_venue_id", None):
         return state.current_venue_id
-    if getattr(state, "shop_mode", False):
-        return "town_shop"
-    if getattr(state, "hall_mode", False):
-        return "town_hall"
-    if getattr(state, "inn_mode", False):
-        return "town_inn"
-    if getattr(state, "alchemist_mode", False):
-        return "town_alchemist"
-    if getattr(state, "temple_mode", False):
-        return "town_temple"
-    if getattr(state, "smithy_mode", False):
-        return "town_smithy"
-    if getattr(state, "portal_mode", False):
-        return "town_portal"
+    for attr, venue_id in _MODE_TO_VENUE:
+        if getattr(state, attr, False):
+            return venue_id
     return None
 
 
-def venue_actions(ctx: Any, state: Any, venue_id: str) -> list[dict]:
-    venue = ctx.venues.get(venue_id, {}) if venue_id else {}
-    def _with_cost(label: str, cost: int | None) -> str:
-        if cost is None:
-            return label
-        if "GP:" in label:
-            return label
-        return f"{label} GP:{cost}"
-    if venue_id == "town_shop":
-        element = getattr(state.player, "current_element", "base")
-        commands = shop_commands(venue, ctx.items, element, state.shop_view, state.player)
-        return commands
-    if venue_id == "town_alchemist":
-        commands: list[dict] = []
-        if not getattr(state, "alchemy_selecting", False):
-            can_fuse = len(_fusable_gear(state)) >= 2
-            entry = {"label": "Fuse", "command": "ALCHEMY_FUSE"}
-            fuse_cost = venue.get("fuse_cost")
-            if isinstance(fuse_cost, int) and fuse_cost > 0:
-                entry["label"] = _with_cost(entry["label"], fuse_cost)
-            if not can_fuse:
-                entry["_disabled"] = True
-            commands.append(entry)
-            return _append_leave(commands)
-        candidates = _fusable_gear(state, getattr(state, "alchemy_first", None))
-        for idx, gear in enumerate(candidates[:9], start=1):
-            label = gear.get("name", "Gear")
-            command = f"ALCHEMY_PICK:{idx}"
-            commands.append({"label": label, "command": command})
-        if not commands:
-            commands.append({"label": "No compatible gear.", "_disabled": True})
-        return _append_leave(commands)
+def _with_cost(label: str, cost: int | None) -> str:
+    if cost is None:
+        return label
+    if "GP:" in label:
+        return label
+    return f"{label} GP:{cost}"
+
 
-    if venue_id == "town_portal":
-        elements = list(getattr(state.player, "elements", []) or [])
-        if hasattr(ctx, "continents"):
-            order = list(ctx.continents.order() or [])
-            elements = [e for e in order if e in elements] or elements
-        commands = []
-        current_element = getattr(state.player, "current_element", None)
-        for element in elements:
-            label = ctx.continents.name_for(element) if hasattr(ctx, "continents") else element.title()
-            entry = {"label": label, "command": f"PORTAL:{element}"}
-            if element == current_element:
-                entry["_disabled"] = True
-            commands.append(entry)
-        if not commands:
-            commands.append({"label": "No continents unlocked.", "_disabled": True})
+def _shop_actions(ctx: Any, state: Any, venue: dict) -> list[dict]:
+    element = getattr(state.player, "current_element", "base")
+    inventory = _shop_inventory(ctx, venue, element) if state.shop_view == "buy" else None
+    commands = shop_commands(venue, ctx.items, element, state.shop_view, state.player, inventory)
+    return commands
+
+
+def _alchemist_actions(ctx: Any, state: Any, venue: dict) -> list[dict]:
+    commands: list[dict] = []
+    if not getattr(state, "alchemy_selecting", False):
+        can_fuse = len(_fusable_gear(state)) >= 2
+        entry = {"label": "Fuse", "command": "ALCHEMY_FUSE"}
+        fuse_cost = venue.get("fuse_cost")
+        if isinstance(fuse_cost, int) and fuse_cost > 0:
+            entry["label"] = _with_cost(entry["label"], fuse_cost)
+        if not can_fuse:
+            entry["_disabled"] = True
+        commands.append(entry)
         return _append_leave(commands)
+    candidates = _fusable_gear(state, getattr(state, "alchemy_first", None))
+    for idx, gear in enumerate(candidates[:9], start=1):
+        label = gear.get("name", "Gear")
+        command = f"ALCHEMY_PICK:{idx}"
+        commands.append({"label": label, "command": command})
+    if not commands:
+        commands.append({"label": "No compatible gear.", "_disabled": True})
+    return _append_leave(commands)
 
-    if isinstance(venue.get("commands"), list):
-        commands = [dict(entry) for entry in venue.get("commands", []) if isinstance(entry, dict)]
-    else:
-        commands = []
+
+def _portal_actions(ctx: Any, state: Any, venue: dict) -> list[dict]:
+    elements = list(getattr(state.player, "elements", []) or [])
+    if hasattr(ctx, "continents"):
+        order = list(ctx.continents.order() or [])
+        elements = [e for e in order if e in elements] or elements
+    commands = []
+    current_element = getattr(state.player, "current_element", None)
+    for element in elements:
+        label = ctx.continents.name_for(element) if hasattr(ctx, "continents") else element.title()
+        entry = {"label": label, "command": f"PORTAL:{element}"}
+        if element == current_element:
+            entry["_disabled"] = True
+        commands.append(entry)
+    if not commands:
+        commands.append({"label": "No continents unlocked.", "_disabled": True})
+    return _append_leave(commands)
+
+
+def _default_actions(ctx: Any, state: Any, venue: dict) -> list[dict]:
+    commands = [dict(entry) for entry in _venue_commands(venue)]
     services = venue.get("services", {}) if isinstance(venue.get("services"), dict) else {}
     for entry in commands:
         label = str(entry.get("label", "")).strip()
@@ -228,145 +418,52 @@ def venue_actions(ctx: Any, state: Any, venue_id: str) -> list[dict]:
     return _append_leave(commands)
 
 
-def handle_venue_command(ctx: Any, state: Any, venue_id: str, command_id: str) -> bool:
-    if not command_id:
-        return False
-    if command_id in ("B_KEY", "LEAVE"):
-        venue = ctx.venues.get(venue_id, {}) if venue_id else {}
-        state.shop_mode = False
-        state.shop_view = "menu"
-        state.hall_mode = False
-        state.inn_mode = False
-        state.alchemist_mode = False
-        state.alchemy_first = None
-        state.alchemy_selecting = False
-        state.temple_mode = False
-        state.smithy_mode = False
-        state.portal_mode = False
-        state.current_venue_id = None
-        state.last_message = venue.get("leave_message", "You leave the venue.")
-        return True
+_ACTION_DISPATCH = {
+    "town_shop": _shop_actions,
+    "town_alchemist": _alchemist_actions,
+    "town_portal": _portal_actions,
+}
 
-    if venue_id == "town_shop":
-        venue = ctx.venues.get(venue_id, {})
-        element = getattr(state.player, "current_element", "base")
-        if command_id == "SHOP_BUY":
-            state.shop_view = "buy"
-            state.last_message = "Choose an item to buy."
-            return True
-        if command_id == "SHOP_SELL":
-            state.shop_view = "sell"
-            state.last_message = "Choose an item to sell."
-            return True
-        if state.shop_view == "buy":
-            selection = next(
-                (entry for entry in shop_inventory(venue, ctx.items, element) if entry.get("command") == command_id),
-                None
-            )
-            if selection:
-                item_id = selection.get("item_id")
-                if item_id:
-                    state.last_message = purchase_item(state.player, ctx.items, item_id)
-                    if state.last_message.startswith("Purchased") and hasattr(ctx, "audio"):
-                        ctx.audio.play_sfx_once("asc_triads_sfx", "C4")
-                    if hasattr(ctx, "quests") and ctx.quests is not None:
-                        quest_messages = evaluate_quests(
-                            state.player,
-                            ctx.quests,
-                            ctx.items,
-                            ctx.spells,
-                            ctx.followers,
-                            ctx.quest_objectives,
-                            ctx.quest_events,
-                        )
-                        if quest_messages:
-                            state.last_message = f"{state.last_message} " + " ".join(quest_messages)
-                            state.quest_mode = True
-                            state.quest_detail_mode = False
-                            state.quest_detail_id = None
-                            state.quest_detail_page = 0
-                            state.shop_mode = False
-                            state.hall_mode = False
-                            state.inn_mode = False
-                            state.inventory_mode = False
-                            state.spell_mode = False
-                            state.element_mode = False
-                            state.alchemist_mode = False
-                            state.temple_mode = False
-                            state.smithy_mode = False
-                            state.portal_mode = False
-                    ctx.save_data.save_player(state.player)
-                return True
-        if state.shop_view == "sell":
-            selection = next(
-                (entry for entry in shop_sell_inventory(state.player, ctx.items) if entry.get("command") == command_id),
-                None
-            )
-            if selection:
-                item_id = selection.get("item_id")
-                if item_id:
-                    state.last_message = sell_item(state.player, ctx.items, item_id)
-                    ctx.save_data.save_player(state.player)
-                return True
-
-    if venue_id == "town_alchemist":
-        if command_id == "ALCHEMY_FUSE":
-            if len(_fusable_gear(state)) < 2:
-                state.last_message = "You need at least two compatible items."
-                return True
-            state.alchemy_selecting = True
-            state.alchemy_first = None
-            state.action_cursor = 0
-            state.last_message = "Select the first item to fuse."
-            return True
-        if command_id.startswith("ALCHEMY_PICK:"):
-            idx_raw = command_id.split(":", 1)[1]
-            if not idx_raw.isdigit():
-                return False
-            candidates = _fusable_gear(state, getattr(state, "alchemy_first", None))
-            idx = int(idx_raw) - 1
-            if idx < 0 or idx >= len(candidates):
-                return False
-            gear_id = candidates[idx].get("id")
-            if not gear_id:
-                return False
-            if not state.alchemy_first:
-                state.alchemy_first = gear_id
-                state.action_cursor = 0
-                state.last_message = "Select a second item to fuse."
-                return True
-            if state.alchemy_first == gear_id:
-                state.last_message = "Choose a different item."
-                return True
-            owner_type, owner_id = state.player.gear_owner(state.alchemy_first)
-            fused = state.player.fuse_gear(state.alchemy_first, gear_id, auto_equip=False)
-            state.alchemy_first = None
-            state.alchemy_selecting = False
-            state.action_cursor = 0
-            if fused:
-                if owner_type == "player":
-                    slot = fused.get("slot")
-                    if slot:
-                        state.player.equipment[slot] = fused.get("id")
-                        state.player._recalc_gear()
-                elif owner_type == "follower" and owner_id:
-                    follower = state.player.follower_by_id(owner_id)
-                    if follower:
-                        state.player.assign_gear_to_follower(follower, fused.get("id"))
-                state.last_message = f"Fused into {fused.get('name', 'gear')}."
-                if hasattr(ctx, "audio"):
-                    ctx.audio.play_sfx_once("asc_triads", "C4")
+
+def venue_actions(ctx: Any, state: Any, venue_id: str) -> list[dict]:
+    venue = ctx.venues.get(venue_id, {}) if venue_id else {}
+    handler = _ACTION_DISPATCH.get(venue_id, _default_actions)
+    return handler(ctx, state, venue)
+
+
+def _reset_modes(state: Any) -> None:
+    for attr, value in _VENUE_RESET:
+        setattr(state, attr, value)
+
+
+def _shop_command(ctx: Any, state: Any, venue_id: str, command_id: str) -> bool:
+    venue = ctx.venues.get(venue_id, {})
+    element = getattr(state.player, "current_element", "base")
+    if command_id == "SHOP_BUY":
+        state.shop_view = "buy"
+        state.last_message = "Choose an item to buy."
+        return True
+    if command_id == "SHOP_SELL":
+        state.shop_view = "sell"
+        state.last_message = "Choose an item to sell."
+        return True
+    if state.shop_view == "buy":
+        selection = _inventory_by_command(ctx, venue, element).get(command_id)
+        if selection:
+            item_id = selection.get("item_id")
+            if item_id:
+                state.last_message = purchase_item(state.player, ctx.items, item_id)
+                if state.last_message.startswith("Purchased") and hasattr(ctx, "audio"):
+                    ctx.audio.play_sfx_once("asc_triads_sfx", "C4")
                 if hasattr(ctx, "quests") and ctx.quests is not None:
-                    quest_messages = emit_quest_events(
+                    quest_messages = evaluate_quests(
                         state.player,
                         ctx.quests,
-                        ctx.quest_events,
-                        "fuse_gear",
-                        [{"item_id": fused.get("item_id", ""), "rank": int(fused.get("fuse_rank", 1) or 1)}],
                         ctx.items,
                         ctx.spells,
                         ctx.followers,
                         ctx.quest_objectives,
+                        ctx.quest_events,
                     )
                     if quest_messages:
                         state.last_message = f"{state.last_message} " + " ".join(quest_messages)
@@ -385,10 +482,121 @@ def handle_venue_command(ctx: Any, state: Any, venue_id: str, command_id: str) -
                         state.smithy_mode = False
                         state.portal_mode = False
                 ctx.save_data.save_player(state.player)
-            else:
-                state.last_message = "Fusion failed."
             return True
+    if state.shop_view == "sell":
+        selection = next(
+            (entry for entry in shop_sell_inventory(state.player, ctx.items) if entry.get("command") == command_id),
+            None
+        )
+        if selection:
+            item_id = selection.get("item_id")
+            if item_id:
+                state.last_message = sell_item(state.player, ctx.items, item_id)
+                ctx.save_data.save_player(state.player)
+            return True
+    return False
+
+
+def _alchemist_command(ctx: Any, state: Any, venue_id: str, command_id: str) -> bool:
+    if command_id == "ALCHEMY_FUSE":
+        if len(_fusable_gear(state)) < 2:
+            state.last_message = "You need at least two compatible items."
+            return True
+        state.alchemy_selecting = True
+        state.alchemy_first = None
+        state.action_cursor = 0
+        state.last_message = "Select the first item to fuse."
+        return True
+    if command_id.startswith("ALCHEMY_PICK:"):
+        idx_raw = command_id.split(":", 1)[1]
+        if not idx_raw.isdigit():
+            return False
+        candidates = _fusable_gear(state, getattr(state, "alchemy_first", None))
+        idx = int(idx_raw) - 1
+        if idx < 0 or idx >= len(candidates):
+            return False
+        gear_id = candidates[idx].get("id")
+        if not gear_id:
+            return False
+        if not state.alchemy_first:
+            state.alchemy_first = gear_id
+            state.action_cursor = 0
+            state.last_message = "Select a second item to fuse."
+            return True
+        if state.alchemy_first == gear_id:
+            state.last_message = "Choose a different item."
+            return True
+        owner_type, owner_id = state.player.gear_owner(state.alchemy_first)
+        fused = state.player.fuse_gear(state.alchemy_first, gear_id, auto_equip=False)
+        state.alchemy_first = None
+        state.alchemy_selecting = False
+        state.action_cursor = 0
+        if fused:
+            if owner_type == "player":
+                slot = fused.get("slot")
+                if slot:
+                    state.player.equipment[slot] = fused.get("id")
+                    state.player._recalc_gear()
+            elif owner_type == "follower" and owner_id:
+                follower = state.player.follower_by_id(owner_id)
+                if follower:
+                    state.player.assign_gear_to_follower(follower, fused.get("id"))
+            state.last_message = f"Fused into {fused.get('name', 'gear')}."
+            if hasattr(ctx, "audio"):
+                ctx.audio.play_sfx_once("asc_triads", "C4")
+            if hasattr(ctx, "quests") and ctx.quests is not None:
+                quest_messages = emit_quest_events(
+                    state.player,
+                    ctx.quests,
+                    ctx.quest_events,
+                    "fuse_gear",
+                    [{"item_id": fused.get("item_id", ""), "rank": int(fused.get("fuse_rank", 1) or 1)}],
+                    ctx.items,
+                    ctx.spells,
+                    ctx.followers,
+                    ctx.quest_objectives,
+                )
+                if quest_messages:
+                    state.last_message = f"{state.last_message} " + " ".join(quest_messages)
+                    state.quest_mode = True
+                    state.quest_detail_mode = False
+                    state.quest_detail_id = None
+                    state.quest_detail_page = 0
+                    state.shop_mode = False
+                    state.hall_mode = False
+                    state.inn_mode = False
+                    state.inventory_mode = False
+                    state.spell_mode = False
+                    state.element_mode = False
+                    state.alchemist_mode = False
+                    state.temple_mode = False
+                    state.smithy_mode = False
+                    state.portal_mode = False
+            ctx.save_data.save_player(state.player)
+        else:
+            state.last_message = "Fusion failed."
+        return True
+    return False
+
+
+_COMMAND_DISPATCH = {
+    "town_shop": _shop_command,
+    "town_alchemist": _alchemist_command,
+}
+
+
+def handle_venue_command(ctx: Any, state: Any, venue_id: str, command_id: str) -> bool:
+    if not command_id:
+        return False
+    if command_id in ("B_KEY", "LEAVE"):
+        venue = ctx.venues.get(venue_id, {}) if venue_id else {}
+        _reset_modes(state)
+        state.last_message = venue.get("leave_message", "You leave the venue.")
+        return True
 
+    handler = _COMMAND_DISPATCH.get(venue_id)
+    if handler:
+        return handler(ctx, state, venue_id, command_id)
     return False
 
 
@@ -400,18 +608,21 @@ def render_venue_body(
     color_map_override: Optional[dict] = None,
 ) -> VenueRender:
     venue = ctx.venues.get(venue_id, {}) if venue_id else {}
+    if not isinstance(venue, dict):
+        venue = {}
     npc_lines = []
-    npc_ids = venue.get("npc_ids", []) if isinstance(venue, dict) else []
+    npc_ids = venue.get("npc_ids", [])
     npc = {}
     if npc_ids:
-        npc_lines = ctx.npcs.format_greeting(npc_ids[0])
+        npc_lines = _greeting_lines(ctx.npcs, id(ctx.npcs.all()), npc_ids[0])
         npc = ctx.npcs.get(npc_ids[0], {})
     body: list[str] = []
     if npc_lines:
-        body += npc_lines + [""]
+        body.extend(npc_lines)
+        body.append("")
 
     if getattr(state, "hall_mode", False):
-        info_sections = venue.get("info_sections", []) if isinstance(venue, dict) else []
+        info_sections = venue.get("info_sections", [])
         section = next((entry for entry in info_sections if entry.get("key") == state.hall_view), None)
         source = section.get("source") if section else None
         if source == "items":
@@ -458,83 +669,38 @@ def render_venue_body(
             entry = ctx.continents.continents().get(selected_element, {})
             if isinstance(entry, dict):
                 portal_message = entry.get("description")
-        right_lines = list(atlas_lines)
+        right_lines, right_width = _portal_atlas(atlas_lines)
         total_lines = max(len(left_lines), len(right_lines))
         content_width = max(0, SCREEN_WIDTH - 2)
-        right_width = max((len(r) for r in right_lines), default=0)
-        right_width = min(right_width, 24)
-        right_width = min(right_width, max(0, content_width))
         left_width = max(0, (content_width - right_width) // 2)
+        digit_colors = {}
+        flicker_digit = None
+        flicker_on = True
+        if hasattr(ctx, "elements"):
+            colors = ctx.colors.all()
+            unlocked = set(getattr(state.player, "elements", []) or [])
+            unlocked_digits = {_ELEMENT_DIGIT[element] for element in unlocked if element in _ELEMENT_DIGIT}
+            for digit, element in _DIGIT_ELEMENT.items():
+                if digit not in unlocked_digits:
+                    continue
+                palette = ctx.elements.colors_for(element)
+                if palette:
+                    digit_colors[digit] = _color_code_for_key(colors, palette[0])
+            flicker_digit = _ELEMENT_DIGIT.get(selected_element)
+            if flicker_digit:
+                flicker_on = (int(time.time() * _FLICKER_RATE) & 1) == 0
+        colored_lines = _colorize_atlas_block(right_lines, digit_colors, flicker_digit, flicker_on)
         for i in range(total_lines):
             left = left_lines[i] if i < len(left_lines) else ""
-            right = right_lines[i] if i < len(right_lines) else ""
             if left_width and len(left) > left_width:
                 left = left[:left_width]
             line = left.ljust(left_width)
-            if right:
-                if right_width and len(right) > right_width:
-                    right = right[:right_width]
-                digit_colors = {}
-                flicker_digit = None
-                flicker_on = True
-                locked_color = f"{ANSI.FG_WHITE}{ANSI.DIM}"
-                if hasattr(ctx, "elements"):
-                    colors = ctx.colors.all()
-                    unlocked = set(getattr(state.player, "elements", []) or [])
-                    unlocked_digits = set()
-                    if "base" in unlocked:
-                        unlocked_digits.add("1")
-                    if "earth" in unlocked:
-                        unlocked_digits.add("2")
-                    if "wind" in unlocked or "air" in unlocked:
-                        unlocked_digits.add("3")
-                    if "fire" in unlocked:
-                        unlocked_digits.add("4")
-                    if "water" in unlocked:
-                        unlocked_digits.add("5")
-                    if "light" in unlocked:
-                        unlocked_digits.add("6")
-                    if "lightning" in unlocked:
-                        unlocked_digits.add("7")
-                    if "dark" in unlocked:
-                        unlocked_digits.add("8")
-                    if "ice" in unlocked:
-                        unlocked_digits.add("9")
-                    elem_colors = {
-                        "1": ctx.elements.colors_for("base"),
-                        "2": ctx.elements.colors_for("earth"),
-                        "3": ctx.elements.colors_for("wind"),
-                        "4": ctx.elements.colors_for("fire"),
-                        "5": ctx.elements.colors_for("water"),
-                        "6": ctx.elements.colors_for("light"),
-                        "7": ctx.elements.colors_for("lightning"),
-                        "8": ctx.elements.colors_for("dark"),
-                        "9": ctx.elements.colors_for("ice"),
-                    }
-                    for digit, palette in elem_colors.items():
-                        if palette and digit in unlocked_digits:
-                            digit_colors[digit] = _color_code_for_key(colors, palette[0])
-                    selected_map = {
-                        "base": "1",
-                        "earth": "2",
-                        "wind": "3",
-                        "air": "3",
-                        "fire": "4",
-                        "water": "5",
-                        "light": "6",
-                        "lightning": "7",
-                        "dark": "8",
-                        "ice": "9",
-                    }
-                    if selected_element in selected_map:
-                        flicker_digit = selected_map[selected_element]
-                        flicker_on = int(time.time() / 0.35) % 2 == 0
-                colored_right = _colorize_atlas_line(right, digit_colors, flicker_digit, flicker_on, locked_color)
-                line = line + colored_right
+            if i < len(colored_lines):
+                line = line + colored_lines[i]
             body.append(line)
 
     if not getattr(state, "portal_mode", False):
-        body += venue.get("narrative", []) if isinstance(venue, dict) else []
+        body.extend(_venue_narrative(venue))
 
     art_anchor_x = None
     if venue.get("objects"):
@@ -543,7 +709,7 @@ def render_venue_body(
         art_lines, art_color = render_venue_art(venue, npc, color_map_override)
 
     actions = venue_actions(ctx, state, venue_id)
-    title = venue.get("name", "Venue") if isinstance(venue, dict) else "Venue"
+    title = venue.get("name", "Venue")
     return VenueRender(
         title=title,
         body=body,
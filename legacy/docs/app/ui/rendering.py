@@ -37,6 +37,8 @@ COLOR_BY_NAME = {
 _SESSION_RANDOM_SEED = random.SystemRandom().randint(0, 2**31 - 1)
 _MASK_DIGITS = set("0123456789")
 _JITTER_TICK_SECONDS = 0.6
+_CLEAR_SCREEN = "\033[H\033[J"
+_LAST_FRAME: dict = {"key": None}
 
 _ELEMENT_KEY_MAP = {
     "fire": {
@@ -2461,10 +2463,16 @@ def format_player_stats(player: Player) -> List[str]:
 
 
 def clear_screen():
-    sys.stdout.write("\033[H\033[J")
+    _LAST_FRAME["key"] = None
+    sys.stdout.write(_CLEAR_SCREEN)
     sys.stdout.flush()
 
 
+def _frame_key(frame: Frame) -> tuple:
+    # Lists are snapshotted so later in-place edits to a frame still redraw.
+    return tuple(tuple(value) if isinstance(value, list) else value for value in vars(frame).values())
+
+
 
 def format_gradient_location_text(location: str, gradient: Optional[tuple[int, int, int, int, int, int]] = None) -> str:
     """Applies a gradient color effect to the location text and its embellishments."""
@@ -2498,8 +2506,12 @@ def format_gradient_location_text(location: str, gradient: Optional[tuple[int, i
 
 
 def render_frame(frame: Frame):
-    sys.stdout.write(ANSI.CURSOR_HIDE)
-    clear_screen()
+    # Redrawing an identical frame is a no-op on screen; skip composing it.
+    frame_key = _frame_key(frame)
+    if frame_key == _LAST_FRAME["key"]:
+        return
+    _LAST_FRAME["key"] = frame_key
+    # The whole frame (cursor hide, clear, rows) goes out in one write/flush.
     output = []
     cols, rows = SCREEN_WIDTH, SCREEN_HEIGHT
     pad_left = 0
@@ -2574,7 +2586,7 @@ def render_frame(frame: Frame):
             output.append(_compose_line(row_idx, _apply_bg(line, row_idx)))
         while len(output) < SCREEN_HEIGHT:
             output.append(_compose_line(len(output), _apply_bg(" " * SCREEN_WIDTH, len(output))))
-        sys.stdout.write("\n".join(output) + "\n")
+        sys.stdout.write(ANSI.CURSOR_HIDE + _CLEAR_SCREEN + "\n".join(output) + "\n")
         sys.stdout.flush()
         return
 
@@ -2733,8 +2745,7 @@ def render_frame(frame: Frame):
     output.append(_compose_line(abs_row_base + row_idx, _apply_bg(_gradient_line(row_idx, bottom_border), row_idx)))
     row_idx += 1
 
-    sys.stdout.write("\n".join(output) + "\n")
-    sys.stdout.write(ANSI.CURSOR_SHOW)
+    sys.stdout.write(ANSI.CURSOR_HIDE + _CLEAR_SCREEN + "\n".join(output) + "\n" + ANSI.CURSOR_SHOW)
     sys.stdout.flush()
 
 
@@ -3,6 +3,8 @@
 import random
 import textwrap
 import time
+from bisect import bisect_right
+from itertools import groupby
 from dataclasses import dataclass
 import json
 from types import SimpleNamespace
@@ -50,6 +52,7 @@ from app.ui.layout import (
     pad_ansi,
     pad_or_trim_ansi,
     strip_ansi,
+    strip_ansi_lines,
 )
 from app.ui.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from app.ui.rendering import (
@@ -102,8 +105,40 @@ class ScreenContext:
     music: MusicData
 
 
-def _ansi_cells(text: str) -> list[tuple[str, str]]:
-    cells = []
+_PANO_SLICE_CACHE_SIZE = 256
+_NS_PER_SECOND = 1_000_000_000
+_SCROLL_SPEED_SCALE = 1000
+_FLICKER_NS = 350_000_000
+_COLOR_CODE_CACHE: dict = {"colors": None, "codes": {}}
+_SCENE_CACHE: dict[tuple, list[str]] = {}
+_ATLAS_DIGIT_ELEMENTS = (
+    ("1", "base"),
+    ("2", "earth"),
+    ("3", "wind"),
+    ("4", "fire"),
+    ("5", "water"),
+    ("6", "light"),
+    ("7", "lightning"),
+    ("8", "dark"),
+    ("9", "ice"),
+)
+_ATLAS_SELECTED_DIGITS = {
+    "base": "1",
+    "earth": "2",
+    "wind": "3",
+    "air": "3",
+    "fire": "4",
+    "water": "5",
+    "light": "6",
+    "lightning": "7",
+    "dark": "8",
+    "ice": "9",
+}
+
+
+def _ansi_cells(text: str) -> tuple[list[str], list[str]]:
+    chars = []
+    codes = []
     i = 0
     current = ""
     while i < len(text):
@@ -116,9 +151,38 @@ def _ansi_cells(text: str) -> list[tuple[str, str]]:
                 current = text[i:j + 1]
                 i = j + 1
                 continue
-        cells.append((ch, current))
+        chars.append(ch)
+        codes.append(current)
         i += 1
-    return cells
+    return chars, codes
+
+
+def _merge_cells(
+    base_chars: list[str],
+    base_codes: list[str],
+    over_chars: list[str],
+    over_codes: list[str],
+    start_col: int = 0,
+) -> None:
+    # Copy the non-space overlay cells onto the base row in place.
+    end = min(len(base_chars), start_col + len(over_chars))
+    for col in range(max(0, start_col), end):
+        over_ch = over_chars[col - start_col]
+        if over_ch != " ":
+            base_chars[col] = over_ch
+            base_codes[col] = over_codes[col - start_col]
+
+
+def _join_cells(chars: list[str], codes: list[str]) -> str:
+    out = []
+    current = None
+    for ch, code in zip(chars, codes):
+        if code != current:
+            out.append(ANSI.RESET + code)
+            current = code
+        out.append(ch)
+    out.append(ANSI.RESET)
+    return "".join(out)
 
 
 def _menu_line(label: str, selected: bool) -> str:
@@ -151,46 +215,102 @@ def _asset_explorer_music_assets(ctx: ScreenContext, asset_type: str) -> dict:
     return {}
 
 
-def _slice_ansi_wrap(text: str, start: int, width: int) -> str:
-    visible = strip_ansi(text)
-    vis_len = len(visible)
-    if width <= 0:
-        return ""
-    if vis_len == 0:
-        return " " * width
-    start = start % vis_len
-    if start + width <= vis_len:
-        return _slice_ansi(text, start, width)
-    first = vis_len - start
-    return _slice_ansi(text, start, first) + _slice_ansi(text, 0, width - first)
+def _block_width(lines: list) -> int:
+    return max((len(line.rstrip()) for line in strip_ansi_lines([str(line) for line in lines])), default=0)
 
 
-def _slice_ansi(text: str, start: int, width: int) -> str:
-    if width <= 0:
-        return ""
-    out = []
+def _ansi_run_index(text: str) -> tuple[list[int], list[int], list[str], int]:
+    # One entry per run of visible chars that follows a group of escapes:
+    # the run's first visible column, its raw index in text, and the escape
+    # group active for it. Lets a visible slice be resolved with bisect.
+    run_cols = [0]
+    run_pos = [0]
+    run_codes = [""]
     vis_idx = 0
     i = 0
-    end = start + width
     while i < len(text):
-        ch = text[i]
-        if ch == "\x1b" and i + 1 < len(text) and text[i + 1] == "[":
-            j = i + 2
-            while j < len(text) and text[j] != "m":
-                j += 1
-            if j < len(text):
-                seq = text[i:j + 1]
-                if start <= vis_idx < end:
-                    out.append(seq)
+        if text[i] == "\x1b" and i + 1 < len(text) and text[i + 1] == "[":
+            group_start = i
+            while i < len(text) and text[i] == "\x1b" and i + 1 < len(text) and text[i + 1] == "[":
+                j = text.find("m", i + 2)
+                if j == -1:
+                    break
                 i = j + 1
+            if i == group_start:
+                i += 1
+                vis_idx += 1
                 continue
-        if start <= vis_idx < end:
-            out.append(ch)
+            if run_cols[-1] == vis_idx:
+                run_pos[-1] = i
+                run_codes[-1] = text[group_start:i]
+            else:
+                run_cols.append(vis_idx)
+                run_pos.append(i)
+                run_codes.append(text[group_start:i])
+            continue
         vis_idx += 1
         i += 1
+    return run_cols, run_pos, run_codes, vis_idx
+
+
+def _slice_ansi_indexed(text: str, index: tuple, start: int, width: int) -> str:
+    run_cols, run_pos, run_codes, vis_len = index
+    if width <= 0:
+        return ""
+    if vis_len == 0:
+        return " " * width
+    out = []
+    col = start % vis_len
+    remaining = width
+    while remaining > 0:
+        take = min(remaining, vis_len - col)
+        first_run = bisect_right(run_cols, col) - 1
+        last_col = col + take - 1
+        last_run = bisect_right(run_cols, last_col) - 1
+        begin = run_pos[first_run] + (col - run_cols[first_run])
+        end = run_pos[last_run] + (last_col - run_cols[last_run]) + 1
+        out.append(run_codes[first_run])
+        out.append(text[begin:end])
+        remaining -= take
+        col = 0
     return "".join(out)
 
 
+def _object_width(objects_data: ObjectsData, obj_id: str) -> int:
+    obj = objects_data.get(obj_id, {})
+    art = obj.get("art", [])
+    return max((len(line) for line in art), default=0)
+
+
+def _build_object_strip(
+    rng: random.Random,
+    options: list[str],
+    widths: dict[str, int],
+    target_width: int,
+    has_grass: bool,
+) -> list[dict]:
+    strip = []
+    width = 0
+    while width < target_width and options:
+        obj_id = rng.choice(options)
+        strip.append({"id": obj_id})
+        obj_w = widths[obj_id]
+        width += obj_w
+        if obj_w == 0:
+            break
+        if width < target_width and has_grass:
+            strip.append({"id": "grass_1"})
+            width += widths["grass_1"]
+    return strip
+
+
+def _pad_height(lines: list[str], height: int) -> list[str]:
+    if len(lines) >= height:
+        return lines[:height]
+    pad_width = len(strip_ansi(lines[0])) if lines else SCREEN_WIDTH
+    return lines + ([" " * pad_width] * (height - len(lines)))
+
+
 def _title_state_config(
     ctx: ScreenContext,
     player,
@@ -351,19 +471,6 @@ def _title_state_config(
                 selected_idx = 0
             arts = []
             colors = ctx.colors.all() if hasattr(ctx, "colors") else {}
-            def _apply_mask_line(line: str, mask: str) -> str:
-                if not line or not isinstance(colors, dict):
-                    return line
-                out = []
-                padded_mask = mask.ljust(len(line))
-                for idx, ch in enumerate(line):
-                    mask_ch = padded_mask[idx] if idx < len(padded_mask) else ""
-                    code = _color_code_for_key(colors, mask_ch) if mask_ch else ""
-                    if code and ch != " ":
-                        out.append(f"{code}{ch}{ANSI.RESET}")
-                    else:
-                        out.append(ch)
-                return "".join(out)
             for idx, player_id in enumerate(player_ids[:2]):
                 entry = players.get(player_id, {})
                 art = entry.get("art", [])
@@ -372,7 +479,7 @@ def _title_state_config(
                 if isinstance(masks, list) and masks and isinstance(colors, dict):
                     colored = []
                     for line, mask in zip(art_lines, masks):
-                        colored.append(_apply_mask_line(str(line), str(mask)))
+                        colored.append(_apply_mask_line(str(line), str(mask), colors))
                     art_lines = colored
                 width = max((len(strip_ansi(line)) for line in art_lines), default=0)
                 height = max(len(art_lines), 1)
@@ -698,6 +805,19 @@ def _truecolor(hex_code: str) -> str:
 def _color_code_for_key(colors: dict, key: str) -> str:
     if not key:
         return ""
+    # colors.json is loaded once and never mutated, so resolved codes are
+    # cached per colors dict (held by reference so its id cannot be reused).
+    if _COLOR_CODE_CACHE["colors"] is not colors:
+        _COLOR_CODE_CACHE["colors"] = colors
+        _COLOR_CODE_CACHE["codes"] = {}
+    codes = _COLOR_CODE_CACHE["codes"]
+    code = codes.get(key)
+    if code is None:
+        code = codes[key] = _resolve_color_code(colors, key)
+    return code
+
+
+def _resolve_color_code(colors: dict, key: str) -> str:
     entry = colors.get(key)
     if isinstance(entry, dict):
         hex_code = entry.get("hex", "") if isinstance(entry.get("hex"), str) else ""
@@ -724,6 +844,28 @@ def _color_code_for_key(colors: dict, key: str) -> str:
     return COLOR_BY_NAME.get(lowered, "")
 
 
+def _apply_mask_line(line: str, mask: str, colors: dict) -> str:
+    if not line or not isinstance(colors, dict):
+        return line
+    padded_mask = mask.ljust(len(line))
+    out = []
+    pos = 0
+    for (mask_ch, is_space), run in groupby(zip(padded_mask, line), key=_mask_run_key):
+        end = pos + sum(1 for _ in run)
+        text = line[pos:end]
+        pos = end
+        if is_space:
+            out.append(text)
+            continue
+        code = _color_code_for_key(colors, mask_ch)
+        out.append(f"{code}{text}{ANSI.RESET}" if code else text)
+    return "".join(out)
+
+
+def _mask_run_key(pair: tuple[str, str]) -> tuple[str, bool]:
+    return pair[0], pair[1] == " "
+
+
 def _color_key_to_rgb(colors: dict, key: str) -> Optional[tuple[int, int, int]]:
     entry = colors.get(key)
     if isinstance(entry, dict):
@@ -909,6 +1051,96 @@ def _spell_effect_with_art(ctx: ScreenContext, spell: dict) -> Optional[dict]:
     return effect_override
 
 
+def _atlas_digit_colors(elements_data: ElementsData, colors: dict, unlocked) -> dict:
+    unlocked_set = set(str(e) for e in unlocked)
+    digit_colors = {}
+    for digit, element_key in _ATLAS_DIGIT_ELEMENTS:
+        if element_key not in unlocked_set:
+            continue
+        palette = elements_data.colors_for(element_key)
+        if palette:
+            digit_colors[digit] = _color_code_for_key(colors, palette[0])
+    return digit_colors
+
+
+def _title_follower_lines(
+    ctx: ScreenContext,
+    colors: dict,
+    avatar_id: str,
+    followers: list,
+    hidden_rows: int = 0,
+) -> list[str]:
+    sources = []
+    if avatar_id and hasattr(ctx, "players"):
+        avatar = ctx.players.get(str(avatar_id), {})
+        if isinstance(avatar, dict):
+            art = avatar.get("art", [])
+            if isinstance(art, list) and art:
+                sources.append(([str(line) for line in art], avatar.get("color_map", [])))
+    if followers and hasattr(ctx, "opponents"):
+        opponent_ids = set(ctx.opponents.all().keys()) if hasattr(ctx.opponents, "all") else set()
+        fallback_map = {
+            "mushroom": "mushroom_miranda",
+            "mushroom_mage": "mushroom_miranda",
+            "fairy": "fairy",
+            "wolf": "wolf",
+        }
+        for follower in followers:
+            if not isinstance(follower, dict):
+                continue
+            f_type = str(follower.get("type", ""))
+            opp_id = f_type if f_type in opponent_ids else fallback_map.get(f_type, "")
+            if not opp_id:
+                continue
+            opp = ctx.opponents.get(opp_id, {}) if hasattr(ctx.opponents, "get") else {}
+            art = opp.get("art", []) if isinstance(opp, dict) else []
+            masks = opp.get("color_map", []) if isinstance(opp, dict) else []
+            if isinstance(art, list) and art:
+                sources.append((art, masks))
+
+    masked = isinstance(colors, dict)
+    heights = [
+        min(len(art), len(masks)) if masked and isinstance(masks, list) and masks else len(art)
+        for art, masks in sources
+    ]
+    if max(heights, default=0) <= hidden_rows:
+        return []
+    follower_art_blocks = []
+    for art, masks in sources:
+        if masked and isinstance(masks, list) and masks:
+            colored = []
+            block_width = 0
+            for line, mask in zip(art, masks):
+                line = str(line)
+                colored.append(_apply_mask_line(line, str(mask), colors))
+                block_width = max(block_width, len(line.rstrip()))
+            follower_art_blocks.append((colored, block_width))
+        else:
+            follower_art_blocks.append((art, _block_width(art)))
+
+    follower_lines = []
+    follower_span_width = 0
+    if follower_art_blocks:
+        heights = [len(block) for block, _ in follower_art_blocks]
+        widths = [width for _, width in follower_art_blocks]
+        if widths:
+            follower_span_width = sum(widths) + max(0, len(widths) - 1)
+        total_height = max(heights, default=0)
+        for row in range(total_height):
+            parts = []
+            for (block, _), height, width in zip(follower_art_blocks, heights, widths):
+                start = total_height - height
+                idx = row - start
+                if 0 <= idx < height:
+                    raw = block[idx].rstrip()
+                    line = raw.ljust(width)
+                else:
+                    line = " " * width
+                parts.append(pad_or_trim_ansi(line, width))
+            follower_lines.append(" ".join(parts).ljust(follower_span_width))
+    return follower_lines
+
+
 def _colorize_atlas_line(
     line: str,
     digit_colors: Optional[dict] = None,
@@ -942,37 +1174,28 @@ def _colorize_atlas_line(
     return "".join(out)
 
 
-def _colorize_element_atlas_line(
-    line: str,
+def _element_atlas_table(
     digit_colors: Optional[dict] = None,
     flicker_digit: Optional[str] = None,
     flicker_on: bool = True,
     locked_color: Optional[str] = None,
-) -> str:
-    if not line:
-        return line
-    out = []
-    for ch in line:
-        if digit_colors and ch in digit_colors:
-            if flicker_digit and ch == flicker_digit and not flicker_on:
-                out.append(f"{ANSI.FG_WHITE}{ANSI.DIM}*{ANSI.RESET}")
-            else:
-                out.append(f"{digit_colors[ch]}*{ANSI.RESET}")
-            continue
-        if ch.isdigit() and locked_color:
-            out.append(f"{locked_color}*{ANSI.RESET}")
-            continue
-        if ch in ("a", "b"):
-            out.append(f"{ANSI.FG_BLUE}~{ANSI.RESET}")
-            continue
-        if ch in ("|", "-", "/", "\\"):
-            out.append(f"{ANSI.FG_YELLOW}{ch}{ANSI.RESET}")
-            continue
-        if ch == "o":
-            out.append(f"{ANSI.FG_WHITE}{ANSI.DIM}{ch}{ANSI.RESET}")
-            continue
-        out.append(ch)
-    return "".join(out)
+) -> dict:
+    table = {
+        ord("a"): f"{ANSI.FG_BLUE}~{ANSI.RESET}",
+        ord("b"): f"{ANSI.FG_BLUE}~{ANSI.RESET}",
+        ord("o"): f"{ANSI.FG_WHITE}{ANSI.DIM}o{ANSI.RESET}",
+    }
+    for ch in ("|", "-", "/", "\\"):
+        table[ord(ch)] = f"{ANSI.FG_YELLOW}{ch}{ANSI.RESET}"
+    if locked_color:
+        for ch in "0123456789":
+            table[ord(ch)] = f"{locked_color}*{ANSI.RESET}"
+    for ch, code in (digit_colors or {}).items():
+        if flicker_digit and ch == flicker_digit and not flicker_on:
+            table[ord(ch)] = f"{ANSI.FG_WHITE}{ANSI.DIM}*{ANSI.RESET}"
+        else:
+            table[ord(ch)] = f"{code}*{ANSI.RESET}"
+    return table
 
 
 def generate_frame(
@@ -1688,7 +1911,7 @@ def generate_frame(
                                 if row_idx not in overlay_rows:
                                     updated.append(line)
                                     continue
-                                cells = _ansi_cells(pad_or_trim_ansi(line, width))
+                                chars, codes = _ansi_cells(pad_or_trim_ansi(line, width))
                                 row_map = overlay_rows[row_idx]
                                 for col, (ch, mask_ch) in row_map.items():
                                     key = mask_ch or color_key
@@ -1699,9 +1922,10 @@ def generate_frame(
                                         seed ^= (quest_art_effect_frame * 0x9E3779B1)
                                     code = _overlay_color_code(key, seed)
                                     draw = glyph if glyph else ch
-                                    if 0 <= col < len(cells):
-                                        cells[col] = (draw, code or cells[col][1])
-                                rebuilt = "".join(f"{code}{ch}" for ch, code in cells) + ANSI.RESET
+                                    if 0 <= col < len(chars):
+                                        chars[col] = draw
+                                        codes[col] = code or codes[col]
+                                rebuilt = "".join(f"{code}{ch}" for ch, code in zip(chars, codes)) + ANSI.RESET
                                 updated.append(rebuilt)
                             atlas_lines = updated
         atlas_inner_width = max((len(strip_ansi(line)) for line in atlas_lines), default=0)
@@ -1718,36 +1942,9 @@ def generate_frame(
         flicker_digit = None
         flicker_on = True
         if selected_element and hasattr(ctx, "elements"):
-            colors = ctx.colors.all()
-            elem_colors = {
-                "1": ("base", ctx.elements.colors_for("base")),
-                "2": ("earth", ctx.elements.colors_for("earth")),
-                "3": ("wind", ctx.elements.colors_for("wind")),
-                "4": ("fire", ctx.elements.colors_for("fire")),
-                "5": ("water", ctx.elements.colors_for("water")),
-                "6": ("light", ctx.elements.colors_for("light")),
-                "7": ("lightning", ctx.elements.colors_for("lightning")),
-                "8": ("dark", ctx.elements.colors_for("dark")),
-                "9": ("ice", ctx.elements.colors_for("ice")),
-            }
-            unlocked_set = set(str(e) for e in elements)
-            for digit, (element_key, palette) in elem_colors.items():
-                if palette and element_key in unlocked_set:
-                    digit_colors[digit] = _color_code_for_key(colors, palette[0])
-            selected_map = {
-                "base": "1",
-                "earth": "2",
-                "wind": "3",
-                "air": "3",
-                "fire": "4",
-                "water": "5",
-                "light": "6",
-                "lightning": "7",
-                "dark": "8",
-                "ice": "9",
-            }
-            if selected_element in selected_map:
-                flicker_digit = selected_map[selected_element]
+            digit_colors = _atlas_digit_colors(ctx.elements, ctx.colors.all(), elements)
+            if selected_element in _ATLAS_SELECTED_DIGITS:
+                flicker_digit = _ATLAS_SELECTED_DIGITS[selected_element]
                 flicker_on = int(time.time() / 0.35) % 2 == 0
         if has_custom_art and atlas_lines:
             colored_atlas = list(atlas_lines)
@@ -1774,10 +1971,10 @@ def generate_frame(
                 row = start_y + idx
                 if 0 <= row < SCREEN_HEIGHT:
                     overlay = pad_or_trim_ansi((" " * start_x) + line, SCREEN_WIDTH)
-                    base_cells = _ansi_cells(canvas[row])
-                    overlay_cells = _ansi_cells(overlay)
+                    base_chars, base_codes = _ansi_cells(canvas[row])
+                    over_chars, over_codes = _ansi_cells(overlay)
                     merged = []
-                    for (base_ch, base_code), (over_ch, over_code) in zip(base_cells, overlay_cells):
+                    for base_ch, base_code, over_ch, over_code in zip(base_chars, base_codes, over_chars, over_codes):
                         if over_ch == " ":
                             merged.append(ANSI.RESET + base_code + base_ch)
                         else:
@@ -1926,36 +2123,9 @@ def generate_frame(
             flicker_digit = None
             flicker_on = True
             if selected_element and hasattr(ctx, "elements"):
-                colors = ctx.colors.all()
-                elem_colors = {
-                    "1": ("base", ctx.elements.colors_for("base")),
-                    "2": ("earth", ctx.elements.colors_for("earth")),
-                    "3": ("wind", ctx.elements.colors_for("wind")),
-                    "4": ("fire", ctx.elements.colors_for("fire")),
-                    "5": ("water", ctx.elements.colors_for("water")),
-                    "6": ("light", ctx.elements.colors_for("light")),
-                    "7": ("lightning", ctx.elements.colors_for("lightning")),
-                    "8": ("dark", ctx.elements.colors_for("dark")),
-                    "9": ("ice", ctx.elements.colors_for("ice")),
-                }
-                unlocked_set = set(str(e) for e in unlocked)
-                for digit, (element_key, palette) in elem_colors.items():
-                    if palette and element_key in unlocked_set:
-                        digit_colors[digit] = _color_code_for_key(colors, palette[0])
-                selected_map = {
-                    "base": "1",
-                    "earth": "2",
-                    "wind": "3",
-                    "air": "3",
-                    "fire": "4",
-                    "water": "5",
-                    "light": "6",
-                    "lightning": "7",
-                    "dark": "8",
-                    "ice": "9",
-                }
-                if selected_element in selected_map:
-                    flicker_digit = selected_map[selected_element]
+                digit_colors = _atlas_digit_colors(ctx.elements, ctx.colors.all(), unlocked)
+                if selected_element in _ATLAS_SELECTED_DIGITS:
+                    flicker_digit = _ATLAS_SELECTED_DIGITS[selected_element]
                     flicker_on = int(time.time() / 0.35) % 2 == 0
             colored_atlas = [
                 _colorize_atlas_line(
@@ -1988,10 +2158,10 @@ def generate_frame(
                     row = start_y + idx
                     if 0 <= row < SCREEN_HEIGHT:
                         overlay = pad_or_trim_ansi((" " * start_x) + line, SCREEN_WIDTH)
-                        base_cells = _ansi_cells(canvas[row])
-                        overlay_cells = _ansi_cells(overlay)
+                        base_chars, base_codes = _ansi_cells(canvas[row])
+                        over_chars, over_codes = _ansi_cells(overlay)
                         merged = []
-                        for (base_ch, base_code), (over_ch, over_code) in zip(base_cells, overlay_cells):
+                        for base_ch, base_code, over_ch, over_code in zip(base_chars, base_codes, over_chars, over_codes):
                             if over_ch == " ":
                                 merged.append(ANSI.RESET + base_code + base_ch)
                             else:
@@ -2291,10 +2461,10 @@ def generate_frame(
                 row = start_y + idx
                 if 0 <= row < SCREEN_HEIGHT:
                     overlay = pad_or_trim_ansi((" " * start_x) + line, SCREEN_WIDTH)
-                    base_cells = _ansi_cells(canvas[row])
-                    overlay_cells = _ansi_cells(overlay)
+                    base_chars, base_codes = _ansi_cells(canvas[row])
+                    over_chars, over_codes = _ansi_cells(overlay)
                     merged = []
-                    for (base_ch, base_code), (over_ch, over_code) in zip(base_cells, overlay_cells):
+                    for base_ch, base_code, over_ch, over_code in zip(base_chars, base_codes, over_chars, over_codes):
                         if over_ch == " ":
                             merged.append(ANSI.RESET + base_code + base_ch)
                         else:
@@ -2595,10 +2765,10 @@ def generate_frame(
                 row = start_y + idx
                 if 0 <= row < SCREEN_HEIGHT:
                     overlay = pad_or_trim_ansi((" " * start_x) + line, SCREEN_WIDTH)
-                    base_cells = _ansi_cells(canvas[row])
-                    overlay_cells = _ansi_cells(overlay)
+                    base_chars, base_codes = _ansi_cells(canvas[row])
+                    over_chars, over_codes = _ansi_cells(overlay)
                     merged = []
-                    for (base_ch, base_code), (over_ch, over_code) in zip(base_cells, overlay_cells):
+                    for base_ch, base_code, over_ch, over_code in zip(base_chars, base_codes, over_chars, over_codes):
                         if over_ch == " ":
                             merged.append(ANSI.RESET + base_code + base_ch)
                         else:
@@ -2712,7 +2882,8 @@ def generate_frame(
                             followers = slot_player.get("followers")
                             if isinstance(followers, list):
                                 title_followers = followers
-        title_color_map = element_color_map(ctx.colors.all(), title_element or "base")
+        title_colors = ctx.colors.all()
+        title_color_map = element_color_map(title_colors, title_element or "base")
         if menu_id == "title_assets_list":
             asset_type = getattr(player, "asset_explorer_type", "") or ""
             def _box(width: int, height: int, content: list[str]) -> list[str]:
@@ -2946,9 +3117,12 @@ def generate_frame(
                 status_lines=[],
                 raw_lines=raw_lines,
             )
+        now_ns = time.monotonic_ns()
+        offset = None
         if scroll_cfg:
             height = int(scroll_cfg.get("height", 10) or 10)
             speed = float(scroll_cfg.get("speed", 1) or 1)
+            speed_q = int(round(speed * _SCROLL_SPEED_SCALE))
             forest_scale = float(scroll_cfg.get("forest_width_scale", 1) or 1)
             forest_scale = max(0.1, min(1.0, forest_scale))
             pano_lines = title_data.get("_panorama_lines")
@@ -2963,11 +3137,8 @@ def generate_frame(
                 base_width = max(0, (SCREEN_WIDTH - gap_min) // 2)
                 target_width = max(1, int(base_width * forest_scale))
                 objects_data = ctx.objects
+                options = []
                 if objects_data:
-                    def obj_width(obj_id: str) -> int:
-                        obj = objects_data.get(obj_id, {})
-                        art = obj.get("art", [])
-                        return max((len(line) for line in art), default=0)
                     options = [
                         "tree_large",
                         "tree_large_2",
@@ -2977,43 +3148,36 @@ def generate_frame(
                         "bush_large_3",
                     ]
                     options = [obj_id for obj_id in options if objects_data.get(obj_id, {}).get("art")]
+                    widths = {obj_id: _object_width(objects_data, obj_id) for obj_id in options + ["grass_1"]}
+                    has_grass = bool(objects_data.get("grass_1", {}).get("art"))
                     rng = random.Random(4242)
-                    def build_strip() -> list[dict]:
-                        strip = []
-                        width = 0
-                        while width < target_width and options:
-                            obj_id = rng.choice(options)
-                            strip.append({"id": obj_id})
-                            width += obj_width(obj_id)
-                            if obj_width(obj_id) == 0:
-                                break
-                            if width < target_width and objects_data.get("grass_1", {}).get("art"):
-                                strip.append({"id": "grass_1"})
-                                width += obj_width("grass_1")
-                        return strip
-                    forest_scene["objects_left"] = build_strip()
-                    forest_scene["objects_right"] = build_strip()
+                    forest_scene["objects_left"] = _build_object_strip(rng, options, widths, target_width, has_grass)
+                    forest_scene["objects_right"] = _build_object_strip(rng, options, widths, target_width, has_grass)
                     forest_scene["gap_min"] = 0
-                forest_lines, _ = render_scene_art(
-                    forest_scene,
-                    [],
-                    objects_data=ctx.objects,
-                    color_map_override=title_color_map,
-                )
-                town_scene = ctx.scenes.get("town", {})
-                town_lines, _ = render_scene_art(
-                    town_scene,
-                    [],
-                    objects_data=ctx.objects,
-                    color_map_override=title_color_map,
-                )
-                def pad_height(lines: list[str], height: int) -> list[str]:
-                    if len(lines) >= height:
-                        return lines[:height]
-                    pad_width = len(strip_ansi(lines[0])) if lines else SCREEN_WIDTH
-                    return lines + ([" " * pad_width] * (height - len(lines)))
-                forest_lines = pad_height(forest_lines, height)
-                town_lines = pad_height(town_lines, height)
+                scene_key = (id(title_colors), title_element or "base", id(objects_data))
+                forest_key = ("forest", *scene_key, forest_scale, height, gap_min, tuple(options))
+                forest_lines = _SCENE_CACHE.get(forest_key)
+                if forest_lines is None:
+                    forest_lines, _ = render_scene_art(
+                        forest_scene,
+                        [],
+                        objects_data=ctx.objects,
+                        color_map_override=title_color_map,
+                    )
+                    _SCENE_CACHE[forest_key] = forest_lines
+                town_key = ("town", *scene_key)
+                town_lines = _SCENE_CACHE.get(town_key)
+                if town_lines is None:
+                    town_scene = ctx.scenes.get("town", {})
+                    town_lines, _ = render_scene_art(
+                        town_scene,
+                        [],
+                        objects_data=ctx.objects,
+                        color_map_override=title_color_map,
+                    )
+                    _SCENE_CACHE[town_key] = town_lines
+                forest_lines = _pad_height(forest_lines, height)
+                town_lines = _pad_height(town_lines, height)
                 pano_lines = []
                 for row in range(height):
                     pano_lines.append(forest_lines[row] + town_lines[row] + forest_lines[row])
@@ -3021,59 +3185,10 @@ def generate_frame(
                 title_data["_panorama_lines"] = pano_lines
                 title_data["_panorama_width"] = pano_width
                 title_data["_panorama_element"] = title_element or "base"
+                title_data["_panorama_index"] = [_ansi_run_index(line) for line in pano_lines]
+                title_data["_pano_slice_cache"] = {}
             view_width = SCREEN_WIDTH
-            offset = int(time.time() * speed) % max(pano_width, 1)
-            art_lines = [
-                _slice_ansi_wrap(line, offset, view_width)
-                for line in pano_lines
-            ]
-
-            logo_lines = []
-            blocking_map = []
-            blocking_char = None
-            logo_object_id = title_data.get("logo_object_id")
-            if logo_object_id:
-                venue_stub = {
-                    "objects": [{"id": logo_object_id}],
-                    "color": "white",
-                }
-                logo_lines, _logo_color, _ = render_venue_objects(
-                    venue_stub,
-                    {},
-                    ctx.objects,
-                    title_color_map,
-                )
-                obj_def = ctx.objects.get(str(logo_object_id), {})
-                blocking_char = obj_def.get("blocking_space")
-                if isinstance(blocking_char, str) and len(blocking_char) == 1:
-                    art = obj_def.get("art", [])
-                    if isinstance(art, list):
-                        for line in art:
-                            row = [(ch == blocking_char) for ch in line]
-                            blocking_map.append(row)
-            if logo_lines:
-                logo_height = len(logo_lines)
-                logo_width = max((len(strip_ansi(line)) for line in logo_lines), default=0)
-                start_y = max(0, (height - logo_height) // 2)
-                start_x = max(0, (view_width - logo_width) // 2)
-                for idx, logo_line in enumerate(logo_lines):
-                    target_row = start_y + idx
-                    if target_row < 0 or target_row >= len(art_lines):
-                        continue
-                    base_cells = _ansi_cells(art_lines[target_row])
-                    logo_cells = _ansi_cells(logo_line)
-                    for col, (ch, code) in enumerate(logo_cells):
-                        if ch == " ":
-                            if blocking_map and idx < len(blocking_map) and col < len(blocking_map[idx]):
-                                if blocking_map[idx][col]:
-                                    pos = start_x + col
-                                    if 0 <= pos < len(base_cells):
-                                        base_cells[pos] = (" ", "")
-                            continue
-                        pos = start_x + col
-                        if 0 <= pos < len(base_cells):
-                            base_cells[pos] = (ch, code)
-                    art_lines[target_row] = "".join(code + ch for ch, code in base_cells) + ANSI.RESET
+            offset = (now_ns * speed_q) // (_NS_PER_SECOND * _SCROLL_SPEED_SCALE) % max(pano_width, 1)
         if getattr(player, "title_name_input", False):
             buffer = str(getattr(player, "title_pending_name", "") or "")
             cursor = getattr(player, "title_name_cursor", (0, 0))
@@ -3092,10 +3207,6 @@ def generate_frame(
                 action_cursor,
                 detail_lines,
             )
-        canvas = []
-        for idx in range(SCREEN_HEIGHT):
-            art_line = art_lines[idx] if idx < len(art_lines) else ""
-            canvas.append(pad_or_trim_ansi(art_line, SCREEN_WIDTH))
         atlas_lines = []
         if hasattr(ctx, "glyphs"):
             atlas = ctx.glyphs.get("element_atlas", {}) if ctx.glyphs else {}
@@ -3105,189 +3216,196 @@ def generate_frame(
         digit_colors = {}
         flicker_digit = None
         flicker_on = True
-        if title_element and hasattr(ctx, "elements"):
-            colors = ctx.colors.all()
-            elem_colors = {
-                "1": ("base", ctx.elements.colors_for("base")),
-                "2": ("earth", ctx.elements.colors_for("earth")),
-                "3": ("wind", ctx.elements.colors_for("wind")),
-                "4": ("fire", ctx.elements.colors_for("fire")),
-                "5": ("water", ctx.elements.colors_for("water")),
-                "6": ("light", ctx.elements.colors_for("light")),
-                "7": ("lightning", ctx.elements.colors_for("lightning")),
-                "8": ("dark", ctx.elements.colors_for("dark")),
-                "9": ("ice", ctx.elements.colors_for("ice")),
-            }
-            unlocked = set(str(e) for e in (unlocked_elements or []))
-            for digit, (element_key, palette) in elem_colors.items():
-                if palette and element_key in unlocked:
-                    digit_colors[digit] = _color_code_for_key(colors, palette[0])
-            selected_map = {
-                "base": "1",
-                "earth": "2",
-                "wind": "3",
-                "air": "3",
-                "fire": "4",
-                "water": "5",
-                "light": "6",
-                "lightning": "7",
-                "dark": "8",
-                "ice": "9",
-            }
-            if title_element in selected_map:
-                flicker_digit = selected_map[title_element]
-                flicker_on = int(time.time() / 0.35) % 2 == 0
-
-        atlas_colored = [
-            ANSI.RESET + _colorize_element_atlas_line(
-                line,
-                digit_colors,
-                flicker_digit,
-                flicker_on,
-                f"{ANSI.FG_WHITE}{ANSI.DIM}",
+        elements_data = getattr(ctx, "elements", None)
+        if title_element and elements_data is not None:
+            elem_key = (tuple(sorted(set(str(e) for e in (unlocked_elements or [])))), id(elements_data))
+            if title_data.get("_elem_colors_key") != elem_key:
+                title_data["_elem_colors"] = _atlas_digit_colors(elements_data, title_colors, elem_key[0])
+                title_data["_elem_colors_key"] = elem_key
+            digit_colors = title_data["_elem_colors"]
+            if title_element in _ATLAS_SELECTED_DIGITS:
+                flicker_digit = _ATLAS_SELECTED_DIGITS[title_element]
+                flicker_on = (now_ns // _FLICKER_NS) & 1 == 0
+
+        follower_key = tuple(
+            str(follower.get("type", "")) for follower in (title_followers or []) if isinstance(follower, dict)
+        )
+        frame_key = (
+            offset,
+            title_element,
+            title_avatar_id,
+            follower_key,
+            flicker_digit,
+            flicker_on,
+            tuple(digit_colors.items()),
+            tuple(menu_lines),
+            menu_y,
+            menu_x,
+            menu_w,
+        )
+        raw_lines = None
+        if title_data.get("_last_frame_key") == frame_key:
+            raw_lines = list(title_data["_last_raw_lines"])
+        if raw_lines is None:
+            if scroll_cfg:
+                slice_cache = title_data.setdefault("_pano_slice_cache", {})
+                cached_slice = slice_cache.get(offset)
+                if cached_slice is None:
+                    cached_slice = tuple(
+                        _slice_ansi_indexed(line, index, offset, view_width)
+                        for line, index in zip(pano_lines, title_data["_panorama_index"])
+                    )
+                    if len(slice_cache) >= _PANO_SLICE_CACHE_SIZE:
+                        slice_cache.pop(next(iter(slice_cache)))
+                    slice_cache[offset] = cached_slice
+                art_lines = list(cached_slice)
+
+                logo_lines = []
+                blocking_map = []
+                blocking_char = None
+                logo_object_id = title_data.get("logo_object_id")
+                if logo_object_id:
+                    venue_stub = {
+                        "objects": [{"id": logo_object_id}],
+                        "color": "white",
+                    }
+                    logo_lines, _logo_color, _ = render_venue_objects(
+                        venue_stub,
+                        {},
+                        ctx.objects,
+                        title_color_map,
+                    )
+                    obj_def = ctx.objects.get(str(logo_object_id), {})
+                    blocking_char = obj_def.get("blocking_space")
+                    if isinstance(blocking_char, str) and len(blocking_char) == 1:
+                        art = obj_def.get("art", [])
+                        if isinstance(art, list):
+                            for line in art:
+                                mask = 0
+                                for col, ch in enumerate(line):
+                                    if ch == blocking_char:
+                                        mask |= 1 << col
+                                blocking_map.append(mask)
+                if logo_lines:
+                    logo_height = len(logo_lines)
+                    logo_width = max((len(strip_ansi(line)) for line in logo_lines), default=0)
+                    start_y = max(0, (height - logo_height) // 2)
+                    start_x = max(0, (view_width - logo_width) // 2)
+                    for idx, logo_line in enumerate(logo_lines):
+                        target_row = start_y + idx
+                        if target_row < 0 or target_row >= len(art_lines):
+                            continue
+                        base_chars, base_codes = _ansi_cells(art_lines[target_row])
+                        logo_chars, logo_codes = _ansi_cells(logo_line)
+                        col = 0
+                        for is_glyph, run in groupby(logo_chars, lambda ch: ch != " "):
+                            run_end = col + sum(1 for _ in run)
+                            if is_glyph:
+                                lo = start_x + col
+                                hi = min(start_x + run_end, len(base_chars))
+                                if lo < hi:
+                                    base_chars[lo:hi] = logo_chars[col:col + hi - lo]
+                                    base_codes[lo:hi] = logo_codes[col:col + hi - lo]
+                            elif idx < len(blocking_map) and blocking_map[idx] >> col & ((1 << (run_end - col)) - 1):
+                                blocking_row = blocking_map[idx]
+                                for space_col in range(col, run_end):
+                                    if blocking_row >> space_col & 1:
+                                        pos = start_x + space_col
+                                        if 0 <= pos < len(base_chars):
+                                            base_chars[pos] = " "
+                                            base_codes[pos] = ""
+                            col = run_end
+                        art_lines[target_row] = "".join(code + ch for ch, code in zip(base_chars, base_codes)) + ANSI.RESET
+
+            canvas = []
+            for idx in range(SCREEN_HEIGHT):
+                art_line = art_lines[idx] if idx < len(art_lines) else ""
+                canvas.append(pad_or_trim_ansi(art_line, SCREEN_WIDTH))
+            # Overlaid rows are edited as char/code cells and serialized once at the end.
+            canvas_cells = {}
+
+            # A full-width menu box hides every span row it covers; the span is bottom-anchored.
+            if menu_x <= 0 and menu_x + menu_w >= SCREEN_WIDTH:
+                menu_rows = range(menu_y, menu_y + len(menu_lines))
+            else:
+                menu_rows = range(0)
+            hidden_rows = 0
+            if menu_rows and menu_rows.stop >= SCREEN_HEIGHT:
+                hidden_rows = SCREEN_HEIGHT - max(menu_rows.start, 0)
+
+            atlas_cells = []
+            if len(atlas_lines) > hidden_rows:
+                table_key = (tuple(digit_colors.items()), flicker_digit, flicker_on)
+                if title_data.get("_atlas_table_key") != table_key:
+                    title_data["_atlas_table"] = _element_atlas_table(
+                        digit_colors,
+                        flicker_digit,
+                        flicker_on,
+                        f"{ANSI.FG_WHITE}{ANSI.DIM}",
+                    )
+                    title_data["_atlas_table_key"] = table_key
+                atlas_table = title_data["_atlas_table"]
+                atlas_cells = [_ansi_cells(ANSI.RESET + line.translate(atlas_table)) for line in atlas_lines]
+            if atlas_cells:
+                atlas_width = max(len(chars) for chars, _ in atlas_cells)
+                for chars, codes in atlas_cells:
+                    pad = atlas_width - len(chars)
+                    chars.extend([" "] * pad)
+                    codes.extend([""] * pad)
+
+            follower_lines = _title_follower_lines(
+                ctx,
+                title_colors,
+                title_avatar_id,
+                title_followers,
+                hidden_rows,
             )
-            for line in atlas_lines
-        ]
-        if atlas_colored:
-            atlas_width = max((len(strip_ansi(line)) for line in atlas_colored), default=0)
-            atlas_colored = [pad_or_trim_ansi(line, atlas_width).ljust(atlas_width) for line in atlas_colored]
-
-        follower_art_blocks = []
-        if title_avatar_id and hasattr(ctx, "players"):
-            avatar = ctx.players.get(str(title_avatar_id), {})
-            if isinstance(avatar, dict):
-                art = avatar.get("art", [])
-                masks = avatar.get("color_map", [])
-                if isinstance(art, list) and art:
-                    if isinstance(masks, list) and masks and hasattr(ctx, "colors"):
-                        colors = ctx.colors.all() if hasattr(ctx, "colors") else {}
-                        if isinstance(colors, dict):
-                            def _apply_mask_line(line: str, mask: str) -> str:
-                                if not line:
-                                    return line
-                                out = []
-                                padded_mask = mask.ljust(len(line))
-                                for idx, ch in enumerate(line):
-                                    mask_ch = padded_mask[idx] if idx < len(padded_mask) else ""
-                                    code = _color_code_for_key(colors, mask_ch) if mask_ch else ""
-                                    if code and ch != " ":
-                                        out.append(f"{code}{ch}{ANSI.RESET}")
-                                    else:
-                                        out.append(ch)
-                                return "".join(out)
-                            colored = []
-                            for line, mask in zip(art, masks):
-                                colored.append(_apply_mask_line(str(line), str(mask)))
-                            follower_art_blocks.append(colored)
-                        else:
-                            follower_art_blocks.append([str(line) for line in art])
-                    else:
-                        follower_art_blocks.append([str(line) for line in art])
-        if title_followers and hasattr(ctx, "opponents"):
-            opponent_ids = set(ctx.opponents.all().keys()) if hasattr(ctx.opponents, "all") else set()
-            fallback_map = {
-                "mushroom": "mushroom_miranda",
-                "mushroom_mage": "mushroom_miranda",
-                "fairy": "fairy",
-                "wolf": "wolf",
-            }
-            colors = ctx.colors.all() if hasattr(ctx, "colors") else {}
-            def _apply_mask_line(line: str, mask: str) -> str:
-                if not line or not isinstance(colors, dict):
-                    return line
-                out = []
-                padded_mask = mask.ljust(len(line))
-                for idx, ch in enumerate(line):
-                    mask_ch = padded_mask[idx] if idx < len(padded_mask) else ""
-                    code = _color_code_for_key(colors, mask_ch) if mask_ch else ""
-                    if code and ch != " ":
-                        out.append(f"{code}{ch}{ANSI.RESET}")
-                    else:
-                        out.append(ch)
-                return "".join(out)
-            for follower in title_followers:
-                if not isinstance(follower, dict):
-                    continue
-                f_type = str(follower.get("type", ""))
-                opp_id = f_type if f_type in opponent_ids else fallback_map.get(f_type, "")
-                if not opp_id:
-                    continue
-                opp = ctx.opponents.get(opp_id, {}) if hasattr(ctx.opponents, "get") else {}
-                art = opp.get("art", []) if isinstance(opp, dict) else []
-                masks = opp.get("color_map", []) if isinstance(opp, dict) else []
-                if isinstance(art, list) and art:
-                    if isinstance(masks, list) and masks and isinstance(colors, dict):
-                        colored = []
-                        for line, mask in zip(art, masks):
-                            colored.append(_apply_mask_line(str(line), str(mask)))
-                        follower_art_blocks.append(colored)
-                    else:
-                        follower_art_blocks.append(art)
-
-        follower_lines = []
-        follower_span_width = 0
-        if follower_art_blocks:
-            heights = [len(block) for block in follower_art_blocks]
-            widths = [max((len(strip_ansi(line).rstrip()) for line in block), default=0) for block in follower_art_blocks]
-            if widths:
-                follower_span_width = sum(widths) + max(0, len(widths) - 1)
-            total_height = max(heights, default=0)
-            for row in range(total_height):
-                parts = []
-                for block, height, width in zip(follower_art_blocks, heights, widths):
-                    start = total_height - height
-                    idx = row - start
-                    if 0 <= idx < height:
-                        raw = block[idx].rstrip()
-                        line = raw.ljust(width)
-                    else:
-                        line = " " * width
-                    parts.append(pad_or_trim_ansi(line, width))
-                follower_lines.append(" ".join(parts).ljust(follower_span_width))
-
-        span_height = max(len(atlas_colored), len(follower_lines))
-        if span_height:
-            start_y = SCREEN_HEIGHT - span_height
-            for row in range(span_height):
-                atlas_idx = row - (span_height - len(atlas_colored))
-                follower_idx = row - (span_height - len(follower_lines))
-                left = atlas_colored[atlas_idx] if 0 <= atlas_idx < len(atlas_colored) else ""
-                right = follower_lines[follower_idx] if 0 <= follower_idx < len(follower_lines) else ""
-                if left and right:
-                    line = f"{left} {right}"
-                else:
-                    line = left or right
-                row_idx = start_y + row
-                if 0 <= row_idx < SCREEN_HEIGHT and line:
-                    base_cells = _ansi_cells(canvas[row_idx])
-                    overlay_cells = _ansi_cells(pad_or_trim_ansi(line, SCREEN_WIDTH))
-                    merged = []
-                    for (base_ch, base_code), (over_ch, over_code) in zip(base_cells, overlay_cells):
-                        if over_ch == " ":
-                            merged.append(ANSI.RESET + base_code + base_ch)
-                        else:
-                            merged.append(ANSI.RESET + over_code + over_ch)
-                    canvas[row_idx] = "".join(merged) + ANSI.RESET
-        for idx, line in enumerate(menu_lines):
-            row = menu_y + idx
-            if 0 <= row < SCREEN_HEIGHT:
-                base_cells = _ansi_cells(canvas[row])
-                overlay_cells = _ansi_cells(pad_or_trim_ansi(line, SCREEN_WIDTH))
-                merged = []
-                for col, ((base_ch, base_code), (over_ch, over_code)) in enumerate(zip(base_cells, overlay_cells)):
-                    in_box = menu_x <= col < (menu_x + menu_w)
-                    if in_box:
-                        if col == menu_x:
-                            merged.append(ANSI.RESET + over_code + over_ch)
-                        else:
-                            merged.append(ANSI.RESET + over_code + over_ch)
+            follower_cells = [_ansi_cells(line) for line in follower_lines]
+
+            span_height = max(len(atlas_cells), len(follower_cells))
+            if span_height:
+                start_y = SCREEN_HEIGHT - span_height
+                for row in range(span_height):
+                    row_idx = start_y + row
+                    if not 0 <= row_idx < SCREEN_HEIGHT or row_idx in menu_rows:
+                        continue
+                    atlas_idx = row - (span_height - len(atlas_cells))
+                    follower_idx = row - (span_height - len(follower_cells))
+                    left = atlas_cells[atlas_idx] if 0 <= atlas_idx < len(atlas_cells) else None
+                    right = follower_cells[follower_idx] if 0 <= follower_idx < len(follower_cells) else None
+                    if left is not None and right is not None:
+                        over_chars = left[0] + [" "] + right[0]
+                        over_codes = left[1] + [""] + right[1]
+                    elif left is not None:
+                        over_chars, over_codes = left
+                    elif right is not None:
+                        over_chars, over_codes = right
                     else:
-                        merged.append(ANSI.RESET + base_code + base_ch)
-                canvas[row] = "".join(merged) + ANSI.RESET
+                        continue
+                    if row_idx not in canvas_cells:
+                        canvas_cells[row_idx] = _ansi_cells(canvas[row_idx])
+                    base_chars, base_codes = canvas_cells[row_idx]
+                    _merge_cells(base_chars, base_codes, over_chars[:SCREEN_WIDTH], over_codes[:SCREEN_WIDTH])
+            for idx, line in enumerate(menu_lines):
+                row = menu_y + idx
+                if 0 <= row < SCREEN_HEIGHT:
+                    if row not in canvas_cells:
+                        canvas_cells[row] = _ansi_cells(canvas[row])
+                    base_chars, base_codes = canvas_cells[row]
+                    over_chars, over_codes = _ansi_cells(pad_or_trim_ansi(line, SCREEN_WIDTH))
+                    box_start = max(0, menu_x)
+                    box_end = min(menu_x + menu_w, len(base_chars), len(over_chars))
+                    if box_start < box_end:
+                        base_chars[box_start:box_end] = over_chars[box_start:box_end]
+                        base_codes[box_start:box_end] = over_codes[box_start:box_end]
+            for row, (chars, codes) in canvas_cells.items():
+                canvas[row] = _join_cells(chars, codes)
+            title_data["_last_frame_key"] = frame_key
+            title_data["_last_raw_lines"] = tuple(canvas)
+            raw_lines = canvas
         body = []
         actions = []
         display_location = "Lokarta - World Maker"
-        raw_lines = canvas
     else:
         scene_data = ctx.scenes.get("forest", {})
         forest_art, art_color = render_scene_art(
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
+import os
 import random
 import sys
 import tempfile
+import time
 import wave
 from array import array
+from functools import lru_cache
+from operator import mul
 from pathlib import Path
+from typing import Iterable, Iterator
 
 
 SCALE_MAPS = {
@@ -31,6 +37,14 @@ NOTE_BASE = {
 
 SAMPLE_RATE = 44100
 DEFAULT_WAVE = "square"
+# Bump when synthesis output changes so stale tones on disk are ignored.
+TONE_CACHE_VERSION = 2
+TONE_CACHE_LIMIT = 64 * 1024 * 1024
+# Temp files older than this were left by a writer that died mid-store.
+TONE_CACHE_TMP_AGE = 60 * 60
+# Distinct audio a CLI song must have before rendering across processes.
+PARALLEL_MIN_FRAMES = SAMPLE_RATE * 60
+_RENDER_WORKER: dict = {}
 
 
 class MusicError(RuntimeError):
@@ -92,40 +106,49 @@ def degree_to_midi(root_midi: int, degree: int, scale: str, octave_shift: int, a
     return root_midi + semitone
 
 
+def _quantize(samples: list[float], gain: float) -> array:
+    # Gain and the 12000 output level fold into one scale, and the clamp
+    # happens in PCM units, so each sample is a single expression.
+    scale = gain * 12000
+    return array("h", [int(max(-12000.0, min(12000.0, s * scale))) for s in samples])
+
+
 def _render_piano_wave(freq: float, duration: float) -> array:
     total_samples = int(SAMPLE_RATE * duration)
     if total_samples <= 0:
         return array("h")
-    harmonics = (
-        (1, 1.00),
-        (2, 0.60),
-        (3, 0.40),
-        (4, 0.25),
-        (5, 0.15),
-        (6, 0.08),
-    )
+    # Harmonics 1..6; only the fundamental needs trig, the rest follow from
+    # sin((k+1)x) = 2cos(x)sin(kx) - sin((k-1)x). The envelope's exp() terms
+    # are running products of a per-sample ratio.
+    a1, a2, a3, a4, a5, a6 = 1.00, 0.60, 0.40, 0.25, 0.15, 0.08
+    sin = math.sin
+    cos = math.cos
+    w = 2.0 * math.pi * freq / SAMPLE_RATE
+    attack_step = math.exp(-60.0 / SAMPLE_RATE)
+    decay_step = math.exp(-3.0 / SAMPLE_RATE)
+    attack = decay = 1.0
     samples = [0.0] * total_samples
     peak = 0.0
     for i in range(total_samples):
-        t = i / SAMPLE_RATE
-        attack = 1.0 - math.exp(-t * 60.0)
-        decay = math.exp(-t * 3.0)
-        env = attack * decay
-        s = 0.0
-        for n, amp in harmonics:
-            s += amp * math.sin(2.0 * math.pi * (freq * n) * t)
-        s *= env
+        x = w * i
+        s1 = sin(x)
+        c = 2.0 * cos(x)
+        s2 = c * s1
+        s3 = c * s2 - s1
+        s4 = c * s3 - s2
+        s5 = c * s4 - s3
+        s6 = c * s5 - s4
+        s = (a1 * s1 + a2 * s2 + a3 * s3 + a4 * s4 + a5 * s5 + a6 * s6) * ((1.0 - attack) * decay)
         samples[i] = s
-        if abs(s) > peak:
-            peak = abs(s)
+        if s > peak:
+            peak = s
+        elif -s > peak:
+            peak = -s
+        attack *= attack_step
+        decay *= decay_step
     if peak <= 0:
         peak = 1.0
-    data = array("h")
-    gain = 1.4
-    for s in samples:
-        value = max(-1.0, min(1.0, (s / peak) * gain))
-        data.append(int(value * 12000))
-    return data
+    return _quantize(samples, 1.4 / peak)
 
 
 def _karplus_strong_harp(freq: float, duration: float, sr: int) -> list[float]:
@@ -192,12 +215,44 @@ def _render_harp_wave(freq: float, duration: float) -> array:
     r1 = _resonator(core, SAMPLE_RATE, f0=220.0, q=2.2, gain=0.25)
     r2 = _resonator(core, SAMPLE_RATE, f0=520.0, q=2.0, gain=0.18)
     mixed = _mix(core, _mix(r1, r2, 1.0, 1.0), scale_a=0.88, scale_b=0.55)
-    data = array("h")
-    gain = 1.35
-    for s in mixed:
-        value = max(-1.0, min(1.0, s * gain))
-        data.append(int(value * 12000))
-    return data
+    return _quantize(mixed, 1.35)
+
+
+# Octave-split halves, and every note of a given length, share one fade
+# ramp instead of recomputing its divisions per tone.
+@lru_cache(maxsize=8)
+def _fade_ramp(fade_samples: int) -> tuple[float, ...]:
+    return tuple(i / fade_samples for i in range(fade_samples))
+
+
+def _phase_ramp(freq: float, total_samples: int, offset: float = 0.0) -> list[float]:
+    # Phase in cycles, accumulated and wrapped per sample so it stays in
+    # [0, 1) instead of growing with t and losing precision on long notes.
+    step = freq / SAMPLE_RATE
+    phase = offset
+    phases = [0.0] * total_samples
+    for i in range(total_samples):
+        phases[i] = phase
+        phase += step
+        if phase >= 1.0:
+            phase -= 1.0
+    return phases
+
+
+def _circle_oscillator(freq: float, total_samples: int) -> list[float]:
+    # Magic-circle recurrence: two multiply-adds per sample instead of a
+    # sin() call. The s term runs 1/cos(w/2) hot, hence the rescale.
+    half_step = math.pi * freq / SAMPLE_RATE
+    eps = 2.0 * math.sin(half_step)
+    scale = math.cos(half_step)
+    values = [0.0] * total_samples
+    s = 0.0
+    c = 1.0
+    for i in range(total_samples):
+        values[i] = s * scale
+        s += eps * c
+        c -= eps * s
+    return values
 
 
 def render_wave(freq: float, duration: float, wave_shape: str) -> array:
@@ -208,33 +263,116 @@ def render_wave(freq: float, duration: float, wave_shape: str) -> array:
         return _render_piano_wave(freq, duration)
     if wave_shape == "harp":
         return _render_harp_wave(freq, duration)
-    data = array("h")
     gain = 1.0
     if wave_shape == "sine":
         gain = 1.4
     elif wave_shape == "triangle":
         gain = 1.6
-    fade_samples = min(int(SAMPLE_RATE * 0.005), total_samples)
-    for i in range(total_samples):
-        t = i / SAMPLE_RATE
-        phase = 2 * math.pi * freq * t
+    # One comprehension per shape: the shape branch is taken once per note,
+    # not once per sample.
+    if wave_shape == "triangle":
+        # 2/pi * asin(sin(2*pi*f*t)) is piecewise linear in the wrapped phase,
+        # so the triangle needs no trig at all.
+        phases = _phase_ramp(freq, total_samples, 0.25)
+        values = [1.0 - 4.0 * abs(phase - 0.5) for phase in phases]
+    elif wave_shape == "sawtooth":
+        values = [2.0 * phase - 1.0 for phase in _phase_ramp(freq, total_samples)]
+    else:
+        values = _circle_oscillator(freq, total_samples)
         if wave_shape == "square":
-            value = 1.0 if math.sin(phase) >= 0 else -1.0
-        elif wave_shape == "triangle":
-            value = 2.0 / math.pi * math.asin(math.sin(phase))
-        elif wave_shape == "sawtooth":
-            value = 2.0 * ((t * freq) % 1.0) - 1.0
-        else:
-            value = math.sin(phase)
-        value *= gain
-        if fade_samples:
-            if i < fade_samples:
-                value *= i / fade_samples
-            elif i > total_samples - fade_samples:
-                value *= (total_samples - i) / fade_samples
-        value = max(-1.0, min(1.0, value))
-        data.append(int(value * 12000))
-    return data
+            values = [1.0 if value >= 0 else -1.0 for value in values]
+    # The fade only touches the first and last few milliseconds.
+    fade_samples = min(int(SAMPLE_RATE * 0.005), total_samples)
+    if fade_samples:
+        ramp = _fade_ramp(fade_samples)
+        values[:fade_samples] = map(mul, values, ramp)
+        tail = max(fade_samples, total_samples - fade_samples + 1)
+        values[tail:] = map(mul, values[tail:], reversed(ramp[1:total_samples - tail + 1]))
+    return _quantize(values, gain)
+
+
+def _tone_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "jpeckenpaugh" / "tones"
+
+
+def _tone_cache_path(freq: float, duration: float, wave_shape: str) -> Path:
+    key = f"v{TONE_CACHE_VERSION}:{wave_shape}:{freq!r}:{duration!r}:{SAMPLE_RATE}"
+    return _tone_cache_dir() / f"{hashlib.sha1(key.encode()).hexdigest()}.pcm"
+
+
+def _load_cached_tone(path: Path, total_samples: int) -> array | None:
+    # Truncated or foreign files count as misses: a short tone would shrink
+    # the sequence buffer it is slice-assigned into.
+    tone = array("h")
+    try:
+        raw = path.read_bytes()
+        if len(raw) != 2 * total_samples:
+            return None
+        tone.frombytes(raw)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return tone
+
+
+def _store_cached_tone(path: Path, tone: array):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(tone.tobytes())
+        os.replace(tmp_path, path)
+        _prune_tone_cache(path.parent)
+    except OSError:
+        pass
+
+
+# Scanning the directory costs O(files), so it is trimmed once per process
+# (on the first write) rather than after every stored tone.
+@lru_cache(maxsize=None)
+def _prune_tone_cache(cache_dir: Path):
+    entries = []
+    total = 0
+    stale = time.time() - TONE_CACHE_TMP_AGE
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pcm"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        elif entry.name.endswith(".tmp") and entry.stat().st_mtime < stale:
+            os.unlink(entry.path)
+    if total <= TONE_CACHE_LIMIT:
+        return
+    # Least recently used first; hits refresh the mtime.
+    for _, size, entry_path in sorted(entries):
+        os.unlink(entry_path)
+        total -= size
+        if total <= TONE_CACHE_LIMIT:
+            break
+
+
+# Songs reuse the same sequences across steps and repeats, so each distinct
+# tone is synthesized once per process, and once per machine via the PCM
+# files under ~/.cache. The cached arrays are only ever copied out of.
+@lru_cache(maxsize=1024)
+def _cached_tone(freq: float, duration: float, wave_shape: str) -> array:
+    try:
+        path = _tone_cache_path(freq, duration, wave_shape)
+    except RuntimeError:
+        # No home directory to cache under.
+        return render_wave(freq, duration, wave_shape)
+    tone = _load_cached_tone(path, max(0, int(SAMPLE_RATE * duration)))
+    if tone is None:
+        tone = render_wave(freq, duration, wave_shape)
+        _store_cached_tone(path, tone)
+    return tone
+
+
+def _render_tone(freq: float, duration: float, wave_shape: str) -> array:
+    if wave_shape == "harp":
+        # Every pluck draws fresh noise; caching would freeze it.
+        return render_wave(freq, duration, wave_shape)
+    return _cached_tone(freq, duration, wave_shape)
 
 
 def resolve_notes(sequence: dict, data: dict) -> list:
@@ -272,6 +410,34 @@ def _resolve_octave_split(sequence: dict, override: str | None) -> str | None:
     return None
 
 
+def _sequence_layout(
+    sequence: dict,
+    data: dict,
+    staccato: bool,
+    octave_split: str | None,
+    tempo_override: float | None,
+) -> tuple[list, float, str | None, bool]:
+    tempo = float(tempo_override if tempo_override is not None else sequence.get("tempo", 120))
+    notes = resolve_notes(sequence, data)
+    if not notes:
+        raise MusicError("Sequence has no notes")
+    split_mode = _resolve_octave_split(sequence, octave_split)
+    staccato = bool((staccato or sequence.get("staccato")) and not split_mode)
+    entries = [normalize_note(entry) for entry in notes]
+    return entries, 60.0 / tempo, split_mode, staccato
+
+
+def _layout_frames(entries: list, seconds_per_beat: float, halved: bool) -> int:
+    total = 0
+    for degree, beats, _, _ in entries:
+        duration = max(0.0, beats * seconds_per_beat)
+        if degree and halved:
+            total += 2 * int(SAMPLE_RATE * (duration * 0.5))
+        else:
+            total += int(SAMPLE_RATE * duration)
+    return total
+
+
 def render_sequence(
     sequence: dict,
     root_midi: int,
@@ -280,65 +446,98 @@ def render_sequence(
     staccato: bool = False,
     octave_split: str | None = None,
     wave_override: str | None = None,
+    scale_override: str | None = None,
+    tempo_override: float | None = None,
 ) -> array:
-    tempo = float(sequence.get("tempo", 120))
-    scale = sequence.get("scale", "major")
+    scale = scale_override or sequence.get("scale", "major")
     wave_shape = wave_override or sequence.get("wave", DEFAULT_WAVE)
-    notes = resolve_notes(sequence, data)
-    if not notes:
-        raise MusicError("Sequence has no notes")
-    buffer = array("h")
-    seconds_per_beat = 60.0 / tempo
-    split_mode = _resolve_octave_split(sequence, octave_split)
-    staccato = bool((staccato or sequence.get("staccato")) and not split_mode)
-    for entry in notes:
-        degree, beats, octave_shift, accidental = normalize_note(entry)
+    entries, seconds_per_beat, split_mode, staccato = _sequence_layout(
+        sequence, data, staccato, octave_split, tempo_override
+    )
+    halved = bool(split_mode or staccato)
+    # Size the whole sequence up front: tones are slice-assigned into a
+    # zeroed buffer, and rests or staccato gaps just advance the position.
+    buffer = array("h", bytes(2 * _layout_frames(entries, seconds_per_beat, halved)))
+    pos = 0
+    for degree, beats, octave_shift, accidental in entries:
         duration = max(0.0, beats * seconds_per_beat)
         if degree == 0:
-            silence = array("h", [0] * int(SAMPLE_RATE * duration))
-            buffer.extend(silence)
+            pos += int(SAMPLE_RATE * duration)
             continue
+        tone_duration = duration * 0.5 if halved else duration
+        count = int(SAMPLE_RATE * tone_duration)
+        midi = degree_to_midi(root_midi, degree, scale, octave_shift, accidental)
+        buffer[pos:pos + count] = _render_tone(midi_to_freq(midi), tone_duration, wave_shape)
+        pos += count
         if split_mode:
-            tone_duration = duration * 0.5
-            midi = degree_to_midi(root_midi, degree, scale, octave_shift, accidental)
-            freq = midi_to_freq(midi)
-            buffer.extend(render_wave(freq, tone_duration, wave_shape))
             shift = 1
             if split_mode == "down":
                 shift = -1
             elif split_mode == "random":
                 shift = random.choice((-1, 1))
             midi = degree_to_midi(root_midi, degree, scale, octave_shift + shift, accidental)
-            freq = midi_to_freq(midi)
-            buffer.extend(render_wave(freq, tone_duration, wave_shape))
-        else:
-            tone_duration = duration * 0.5 if staccato else duration
-            midi = degree_to_midi(root_midi, degree, scale, octave_shift, accidental)
-            freq = midi_to_freq(midi)
-            buffer.extend(render_wave(freq, tone_duration, wave_shape))
-            if staccato:
-                silence = array("h", [0] * int(SAMPLE_RATE * tone_duration))
-                buffer.extend(silence)
+            buffer[pos:pos + count] = _render_tone(midi_to_freq(midi), tone_duration, wave_shape)
+            pos += count
+        elif staccato:
+            pos += count
     return buffer
 
 
-def play_audio(samples: array):
-    if not samples:
-        raise MusicError("No audio generated")
-    if sys.platform == "darwin":
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            tmp_path = Path(tmp.name)
+def _write_temp_wav(chunks: Iterable[array]) -> Path:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+        tmp_path = Path(tmp.name)
+    try:
         with wave.open(str(tmp_path), "wb") as wav:
             wav.setnchannels(1)
             wav.setsampwidth(2)
             wav.setframerate(SAMPLE_RATE)
-            wav.writeframes(samples.tobytes())
-        try:
-            import subprocess
+            for chunk in chunks:
+                wav.writeframes(chunk.tobytes())
+            frames = wav.getnframes()
+        if not frames:
+            raise MusicError("No audio generated")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def _afplay(chunks: Iterable[array], total_frames: int):
+    if not total_frames:
+        raise MusicError("No audio generated")
+    import subprocess
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+        tmp_path = Path(tmp.name)
+    player = None
+    try:
+        # The header carries the final length up front, so afplay starts on
+        # the first chunk while the rest is still being rendered behind it.
+        # writeframesraw leaves that header alone; writeframes would patch it
+        # down to the bytes written so far after every chunk.
+        with open(tmp_path, "wb") as handle, wave.open(handle, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.setnframes(total_frames)
+            for chunk in chunks:
+                wav.writeframesraw(chunk.tobytes())
+                handle.flush()
+                if player is None:
+                    player = subprocess.Popen(["afplay", str(tmp_path)])
+        if player is not None:
+            player.wait()
+    finally:
+        if player is not None and player.poll() is None:
+            player.kill()
+        tmp_path.unlink(missing_ok=True)
+
 
-            subprocess.run(["afplay", str(tmp_path)], check=False)
-        finally:
-            tmp_path.unlink(missing_ok=True)
+def play_audio(samples: array):
+    if not samples:
+        raise MusicError("No audio generated")
+    if sys.platform == "darwin":
+        _afplay((samples,), len(samples))
         return
     try:
         import simpleaudio as sa  # type: ignore
@@ -352,13 +551,7 @@ def play_audio(samples: array):
     if sys.platform == "win32":
         import winsound  # type: ignore
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            tmp_path = Path(tmp.name)
-        with wave.open(str(tmp_path), "wb") as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)
-            wav.setframerate(SAMPLE_RATE)
-            wav.writeframes(samples.tobytes())
+        tmp_path = _write_temp_wav((samples,))
         winsound.PlaySound(str(tmp_path), winsound.SND_FILENAME)
         tmp_path.unlink(missing_ok=True)
         return
@@ -379,23 +572,45 @@ def play_sequence(
     sequences = data.get("sequences", {})
     if name not in sequences:
         raise MusicError(f"Unknown sequence: {name}")
-    sequence = dict(sequences[name])
-    if scale_override:
-        sequence["scale"] = scale_override
-    if tempo_override is not None:
-        sequence["tempo"] = tempo_override
     root_midi = parse_root(root_note)
-    samples = render_sequence(sequence, root_midi, data)
+    samples = render_sequence(
+        sequences[name],
+        root_midi,
+        data,
+        scale_override=scale_override,
+        tempo_override=tempo_override,
+    )
     play_audio(samples)
 
 
-def render_song(
+def _render_step(step: tuple, data: dict, wave_override: str | None) -> array:
+    sequence, root_midi, staccato, octave_split, step_scale, step_tempo = step
+    return render_sequence(
+        sequence,
+        root_midi,
+        data,
+        staccato=staccato,
+        octave_split=octave_split,
+        wave_override=wave_override,
+        scale_override=step_scale,
+        tempo_override=step_tempo,
+    )
+
+
+def _step_frames(step: tuple, data: dict) -> int:
+    sequence, _, staccato, octave_split, _, step_tempo = step
+    entries, seconds_per_beat, split_mode, staccato = _sequence_layout(
+        sequence, data, staccato, octave_split, step_tempo
+    )
+    return _layout_frames(entries, seconds_per_beat, bool(split_mode or staccato))
+
+
+def _song_steps(
     data: dict,
     name: str,
     scale_override: str | None,
     tempo_override: float | None,
-    wave_override: str | None = None,
-) -> array:
+) -> list[tuple]:
     songs = data.get("songs", {})
     if name not in songs:
         raise MusicError(f"Unknown song: {name}")
@@ -407,40 +622,120 @@ def render_song(
         steps = song.get("steps", [])
     if not isinstance(steps, list):
         raise MusicError(f"Invalid song steps for: {name}")
+    # Steps are validated and resolved once; each repeat only renders.
+    sequences = data.get("sequences", {})
+    plan = []
+    for step in steps:
+        if not isinstance(step, dict):
+            raise MusicError(f"Invalid song step: {step}")
+        sequence_name = step.get("sequence")
+        root_note = step.get("root")
+        if not sequence_name or not root_note:
+            raise MusicError(f"Song step missing sequence/root: {step}")
+        step_scale = step.get("scale") or scale_override
+        step_tempo = step.get("tempo")
+        if step_tempo is None:
+            step_tempo = tempo_override
+        if sequence_name not in sequences:
+            raise MusicError(f"Unknown sequence: {sequence_name}")
+        sequence = sequences[sequence_name]
+        staccato = bool(step.get("staccato") or sequence.get("staccato"))
+        plan.append(
+            (sequence, parse_root(root_note), staccato, step.get("octave_split"), step_scale, step_tempo)
+        )
+    return plan * max(1, repeat)
+
+
+def _step_is_random(step: tuple, wave_override: str | None) -> bool:
+    sequence, _, _, octave_split, _, _ = step
+    if (wave_override or sequence.get("wave", DEFAULT_WAVE)) == "harp":
+        return True
+    return _resolve_octave_split(sequence, octave_split) == "random"
+
+
+def _init_render_worker(data: dict, wave_override: str | None):
+    # Reseed so forked workers don't share one random stream; the song data
+    # is shipped once per worker instead of once per step.
+    random.seed()
+    _RENDER_WORKER["data"] = data
+    _RENDER_WORKER["wave_override"] = wave_override
+
+
+def _render_worker_step(step: tuple) -> array:
+    return _render_step(step, _RENDER_WORKER["data"], _RENDER_WORKER["wave_override"])
+
+
+def _render_steps(
+    jobs: list[tuple],
+    data: dict,
+    wave_override: str | None,
+    parallel: bool,
+) -> Iterator[array]:
+    # Repeats of a step are the same tuple, so deterministic steps are keyed
+    # by identity and rendered once; harp plucks and random octave splits
+    # differ per pass and keep one render per position.
+    keys = []
+    distinct: dict[int, tuple] = {}
+    for index, step in enumerate(jobs):
+        key = -1 - index if _step_is_random(step, wave_override) else id(step)
+        keys.append(key)
+        distinct.setdefault(key, step)
+    workers = min(os.cpu_count() or 1, len(distinct))
+    rendered: dict[int, array] = {}
+    if (
+        parallel
+        and workers > 1
+        and sum(_step_frames(step, data) for step in distinct.values()) >= PARALLEL_MIN_FRAMES
+    ):
+        # Threads would serialize on the GIL, so large songs render across
+        # processes. Below the threshold, starting the pool (spawn on macOS)
+        # costs more than the synthesis it would spread out.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(data, wave_override),
+        ) as pool:
+            # Distinct steps come back in first-use order, so each chunk is
+            # yielded as soon as its own render finishes.
+            results = pool.map(_render_worker_step, distinct.values())
+            for key in keys:
+                if key not in rendered:
+                    rendered[key] = next(results)
+                yield rendered[key]
+        return
+    for key in keys:
+        if key not in rendered:
+            rendered[key] = _render_step(distinct[key], data, wave_override)
+        yield rendered[key]
+
+def iter_song(
+    data: dict,
+    name: str,
+    scale_override: str | None,
+    tempo_override: float | None,
+    wave_override: str | None = None,
+    *,
+    parallel: bool = False,
+) -> Iterator[array]:
+    jobs = _song_steps(data, name, scale_override, tempo_override)
+    yield from _render_steps(jobs, data, wave_override, parallel)
+
+
+def render_song(
+    data: dict,
+    name: str,
+    scale_override: str | None,
+    tempo_override: float | None,
+    wave_override: str | None = None,
+    *,
+    parallel: bool = False,
+) -> array:
     buffer = array("h")
-    for _ in range(max(1, repeat)):
-        for step in steps:
-            if not isinstance(step, dict):
-                raise MusicError(f"Invalid song step: {step}")
-            sequence_name = step.get("sequence")
-            root_note = step.get("root")
-            if not sequence_name or not root_note:
-                raise MusicError(f"Song step missing sequence/root: {step}")
-            step_scale = step.get("scale") or scale_override
-            step_tempo = step.get("tempo")
-            if step_tempo is None:
-                step_tempo = tempo_override
-            sequences = data.get("sequences", {})
-            if sequence_name not in sequences:
-                raise MusicError(f"Unknown sequence: {sequence_name}")
-            sequence = dict(sequences[sequence_name])
-            if step_scale:
-                sequence["scale"] = step_scale
-            if step_tempo is not None:
-                sequence["tempo"] = step_tempo
-            staccato = bool(step.get("staccato") or sequence.get("staccato"))
-            octave_split = step.get("octave_split")
-            root_midi = parse_root(root_note)
-            buffer.extend(
-                render_sequence(
-                    sequence,
-                    root_midi,
-                    data,
-                    staccato=staccato,
-                    octave_split=octave_split,
-                    wave_override=wave_override,
-                )
-            )
+    chunks = iter_song(data, name, scale_override, tempo_override, wave_override, parallel=parallel)
+    for chunk in chunks:
+        buffer.extend(chunk)
     return buffer
 
 
@@ -451,7 +746,14 @@ def play_song(
     tempo_override: float | None,
     wave_override: str | None = None,
 ):
-    samples = render_song(data, name, scale_override, tempo_override, wave_override)
+    if sys.platform == "darwin":
+        # afplay reads a file, so steps go straight into the WAV as they
+        # render instead of through one song-sized buffer.
+        jobs = _song_steps(data, name, scale_override, tempo_override)
+        total_frames = sum(_step_frames(step, data) for step in jobs)
+        _afplay(_render_steps(jobs, data, wave_override, parallel=True), total_frames)
+        return
+    samples = render_song(data, name, scale_override, tempo_override, wave_override, parallel=True)
     play_audio(samples)
 
 
@@ -0,0 +1,63 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app import venues
+from app.models import Player
+
+
+ITEMS = {
+    "sword": {"name": "Sword", "slot": "sword", "atk": 2},
+    "shield": {"name": "Shield", "slot": "shield", "defense": 2},
+}
+
+
+def _player(*item_ids: str) -> Player:
+    player = Player.from_dict({})
+    for item_id in item_ids:
+        player.add_gear(item_id, ITEMS, auto_equip=False)
+    return player
+
+
+def _names(gear: list[dict]) -> list[str]:
+    return [entry.get("name") for entry in gear]
+
+
+class FusableGearTests(unittest.TestCase):
+    def setUp(self):
+        venues._FUSABLE_CACHE.clear()
+        self.addCleanup(venues._FUSABLE_CACHE.clear)
+
+    def test_replaced_player_is_not_served_stale_gear(self):
+        # A freed player's ids get reused by the next allocation; collide
+        # them outright so the key matches the old entry every time.
+        with mock.patch.object(venues, "id", lambda obj: 0, create=True):
+            state = SimpleNamespace(player=_player("sword", "sword"))
+            self.assertEqual(_names(venues._fusable_gear(state)), ["Sword", "Sword"])
+            state.player = _player("shield", "shield")
+            self.assertEqual(_names(venues._fusable_gear(state)), ["Shield", "Shield"])
+
+    def test_cache_drops_replaced_players(self):
+        old = SimpleNamespace(player=_player("sword", "sword"))
+        venues._fusable_gear(old)
+        new = SimpleNamespace(player=_player("shield", "shield"))
+        venues._fusable_gear(new)
+        self.assertTrue(all(entry[0] is new.player for entry in venues._FUSABLE_CACHE.values()))
+
+    def test_add_gear_invalidates(self):
+        state = SimpleNamespace(player=_player("sword", "shield"))
+        self.assertEqual(venues._fusable_gear(state), [])
+        state.player.add_gear("sword", ITEMS, auto_equip=False)
+        self.assertEqual(_names(venues._fusable_gear(state)), ["Sword", "Sword"])
+
+    def test_fuse_gear_invalidates(self):
+        state = SimpleNamespace(player=_player("sword", "sword", "sword"))
+        self.assertEqual(len(venues._fusable_gear(state)), 3)
+        first, second = [gear["id"] for gear in state.player.gear_inventory[:2]]
+        state.player.fuse_gear(first, second, auto_equip=False)
+        self.assertEqual(len(venues._fusable_gear(state)), 2)
+        self.assertEqual(venues._fusable_gear(state, first), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
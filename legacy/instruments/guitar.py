@@ -3,11 +3,13 @@
 import math
 import os
 import random
-import struct
 import subprocess
 import sys
 import tempfile
 import wave
+from array import array
+from functools import lru_cache
+from itertools import repeat
 
 
 # -----------------------
@@ -44,36 +46,74 @@ def note_to_freq(note: str) -> float:
 
 def karplus_strong(freq, duration=1.8, sr=44100, decay=0.996):
     N = int(sr / freq)
-    buffer = [random.uniform(-1.0, 1.0) for _ in range(N)]
-
-    samples = []
-    for _ in range(int(duration * sr)):
-        avg = decay * 0.5 * (buffer[0] + buffer[1])
-        samples.append(buffer[0])
-        buffer.append(avg)
-        buffer.pop(0)
+    total = int(duration * sr)
+    # uniform(-1, 1) inlined: one bound random() call per slot.
+    rand = random.random
+    buffer = [-1.0 + 2.0 * rand() for _ in range(N)]
+
+    # The output doubles as the delay line: sample t+N is the averaged pair
+    # (t, t+1), so each step reads N samples back instead of shifting a list.
+    samples = buffer[:total] + [0.0] * (total - N)
+    gain = decay * 0.5
+    for t in range(N, total):
+        samples[t] = gain * (samples[t - N] + samples[t - N + 1])
 
     # normalize
     peak = max(abs(x) for x in samples) or 1.0
     return [x / peak for x in samples]
 
 
-def silence(duration, sr):
-    return [0.0] * int(duration * sr)
+# Melodies repeat pitches, so each (freq, duration) is plucked once per run.
+@lru_cache(maxsize=256)
+def pluck(freq, duration, sr):
+    return tuple(karplus_strong(freq, duration=duration, sr=sr))
+
+
+def silence_frames(duration, sr):
+    # 16-bit zeros straight as bytes; no per-sample float list.
+    return bytes(2 * int(duration * sr))
 
 
 # -----------------------
 # WAV + afplay
 # -----------------------
 
-def write_wav(samples, sr, path):
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sr)
+def open_wav(path, sr):
+    wf = wave.open(path, "w")
+    wf.setnchannels(1)
+    wf.setsampwidth(2)
+    wf.setframerate(sr)
+    return wf
+
+
+def pcm_frames(samples):
+    pcm = array("h", [int(max(-1, min(1, s)) * 32767) for s in samples])
+    if sys.byteorder == "big":
+        pcm.byteswap()  # WAV frames are little-endian
+    return pcm.tobytes()
+
+
+def pluck_frames(freq, duration, sr):
+    return pcm_frames(pluck(freq, duration, sr))
+
+
+# Notes are independent, so distinct pitches are rendered across processes
+# (threads would serialize on the GIL). Workers reseed so forked processes
+# don't share one noise stream.
+# Distinct audio worth spreading across processes; below this, starting
+# the pool costs more than the synthesis it saves.
+PARALLEL_MIN_SECONDS = 10.0
+
+
+def render_voices(freqs, duration, sr):
+    unique = list(dict.fromkeys(freqs))
+    workers = min(os.cpu_count() or 1, len(unique))
+    if workers < 2 or len(unique) * duration < PARALLEL_MIN_SECONDS:
+        return {freq: pluck_frames(freq, duration, sr) for freq in unique}
+    from concurrent.futures import ProcessPoolExecutor
 
-        for s in samples:
-            wf.writeframes(struct.pack("<h", int(max(-1, min(1, s)) * 32767)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as pool:
+        return dict(zip(unique, pool.map(pluck_frames, unique, repeat(duration), repeat(sr))))
 
 
 # -----------------------
@@ -89,20 +129,22 @@ def main():
     notes = [n.strip() for n in sys.argv[1].split(",") if n.strip()]
     sr = 44100
 
-    song = []
     note_dur = 0.9
     gap = 0.05
 
-    for note in notes:
-        freq = note_to_freq(note)
-        song.extend(karplus_strong(freq, duration=note_dur, sr=sr))
-        song.extend(silence(gap, sr))
+    freqs = [note_to_freq(note) for note in notes]
+    voices = render_voices(freqs, note_dur, sr)
+    gap_frames = silence_frames(gap, sr)
 
     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
         path = f.name
 
     try:
-        write_wav(song, sr, path)
+        # Stream the rendered notes into the WAV; no full-song buffer.
+        with open_wav(path, sr) as wf:
+            for freq in freqs:
+                wf.writeframes(voices[freq])
+                wf.writeframes(gap_frames)
         subprocess.run(["afplay", path])
     finally:
         os.unlink(path)
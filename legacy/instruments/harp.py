@@ -3,11 +3,14 @@
 import math
 import os
 import random
-import struct
 import subprocess
 import sys
 import tempfile
 import wave
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from typing import Sequence
 
 
 # -----------------------
@@ -61,90 +64,145 @@ def karplus_strong_harp(freq: float, duration: float, sr: int,
 
     # "Pluck" excitation: slightly shaped noise (less harsh than pure white noise)
     # Using triangular noise reduces buzzy high end.
-    buf = [(random.random() - random.random()) for _ in range(N)]
+    rand = random.random
+    buf = [rand() - rand() for _ in range(N)]
 
-    samples = []
-    prev = 0.0
     total = int(duration * sr)
 
-    for _ in range(total):
-        x0 = buf[0]
-        x1 = buf[1]
-
-        # Averaging filter in feedback loop + extra one-pole damping
-        avg = 0.5 * (x0 + x1)
-        y = decay * ((1.0 - damping) * avg + damping * prev)
-        prev = y
+    # The output doubles as the delay line: sample t reads the pair N samples
+    # back, so nothing is shifted per step.
+    samples = buf[:total] + [0.0] * (total - N)
+    prev = 0.0
 
-        samples.append(x0)
-        buf.append(y)
-        buf.pop(0)
+    # Averaging filter in feedback loop + extra one-pole damping, with the
+    # loop-invariant decay/damping products folded into two gains.
+    pair_gain = 0.5 * decay * (1.0 - damping)
+    prev_gain = decay * damping
+    for t in range(N, total):
+        prev = pair_gain * (samples[t - N] + samples[t - N + 1]) + prev_gain * prev
+        samples[t] = prev
 
     # normalize
     peak = max(abs(s) for s in samples) or 1.0
     return [s / peak for s in samples]
 
 
-def resonator(samples: list[float], sr: int, f0: float, q: float, gain: float) -> list[float]:
+def bandpass_coeffs(sr: int, f0: float, q: float) -> tuple[float, float, float]:
     """
-    Very small 2-pole resonator (biquad) to emulate soundboard resonance.
-    f0: center frequency
-    q: quality factor
-    gain: linear gain applied to the resonated signal
+    Normalized bandpass biquad (constant skirt gain) as (b0, a1, a2).
+    b1 = 0 and b2 = -b0, so the feed-forward taps reduce to b0 * (x0 - x2).
     """
     w0 = 2.0 * math.pi * f0 / sr
     alpha = math.sin(w0) / (2.0 * q)
-
-    # Bandpass (constant skirt gain)
-    b0 = alpha
-    b1 = 0.0
-    b2 = -alpha
     a0 = 1.0 + alpha
-    a1 = -2.0 * math.cos(w0)
-    a2 = 1.0 - alpha
+    return alpha / a0, -2.0 * math.cos(w0) / a0, (1.0 - alpha) / a0
 
-    # normalize coefficients
-    b0 /= a0; b1 /= a0; b2 /= a0
-    a1 /= a0; a2 /= a0
 
-    y = [0.0] * len(samples)
-    x1 = x2 = 0.0
-    y1 = y2 = 0.0
-    for i, x0 in enumerate(samples):
-        y0 = b0*x0 + b1*x1 + b2*x2 - a1*y1 - a2*y2
-        y[i] = gain * y0
-        x2, x1 = x1, x0
-        y2, y1 = y1, y0
+def bloom(core: list[float], sr: int,
+          res_a: tuple[float, float, float], res_b: tuple[float, float, float],
+          scale_core: float, scale_wet: float) -> list[float]:
+    """
+    Soundboard stage: two small 2-pole bandpass resonators (f0, q, gain)
+    over the core, mixed together and then with the core. Both share one
+    pass, so the input history and the x0 - x2 tap are computed once per
+    sample.
+    """
+    ba, a1a, a2a = bandpass_coeffs(sr, res_a[0], res_a[1])
+    bb, a1b, a2b = bandpass_coeffs(sr, res_b[0], res_b[1])
+    ga = res_a[2]
+    gb = res_b[2]
 
-    return y
+    wet = [0.0] * len(core)
+    x1 = x2 = 0.0
+    ya1 = ya2 = yb1 = yb2 = 0.0
+    for i, x0 in enumerate(core):
+        d = x0 - x2
+        ya = ba * d - a1a * ya1 - a2a * ya2
+        yb = bb * d - a1b * yb1 - a2b * yb2
+        wet[i] = ga * ya + gb * yb
+        x2 = x1
+        x1 = x0
+        ya2 = ya1
+        ya1 = ya
+        yb2 = yb1
+        yb1 = yb
+
+    # The resonator sum is normalized on its own before the final mix.
+    peak = max(max(wet, default=0.0), -min(wet, default=0.0))
+    if peak > 1.0:
+        scale_wet /= peak
+    return mix(core, wet, scale_core, scale_wet)
 
 
 def mix(a: list[float], b: list[float], scale_a: float = 1.0, scale_b: float = 1.0) -> list[float]:
-    n = min(len(a), len(b))
-    out = [(scale_a * a[i] + scale_b * b[i]) for i in range(n)]
+    out = [scale_a * x + scale_b * y for x, y in zip(a, b)]
     # normalize to avoid clipping
-    peak = max(abs(s) for s in out) or 1.0
+    peak = max(max(out, default=0.0), -min(out, default=0.0))
     if peak > 1.0:
         out = [s / peak for s in out]
     return out
 
 
-def silence(duration: float, sr: int) -> list[float]:
-    return [0.0] * int(duration * sr)
+@lru_cache(maxsize=256)
+def harp_note(freq: float, duration: float, sr: int) -> tuple[float, ...]:
+    """
+    Full harp voice for one pitch: pluck plus soundboard bloom.
+    Cached so repeated pitches in a melody are synthesized once.
+    """
+    # core pluck (harp rings longer and cleaner)
+    core = karplus_strong_harp(freq, duration=duration, sr=sr, decay=0.9988, damping=0.35)
+
+    # soundboard bloom: resonances as (f0, q, gain) (tweak these for taste)
+    return tuple(bloom(core, sr, (220.0, 2.2, 0.25), (520.0, 2.0, 0.18), scale_core=0.88, scale_wet=0.55))
+
+
+def silence_frames(duration: float, sr: int) -> bytes:
+    # 16-bit zeros straight as bytes; no per-sample float list.
+    return bytes(2 * int(duration * sr))
 
 
 # -----------------------
 # WAV + afplay
 # -----------------------
 
-def write_wav(samples: list[float], sr: int, path: str) -> None:
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit PCM
-        wf.setframerate(sr)
-        for s in samples:
-            s = max(-1.0, min(1.0, s))
-            wf.writeframes(struct.pack("<h", int(s * 32767)))
+def open_wav(path: str, sr: int) -> wave.Wave_write:
+    wf = wave.open(path, "w")
+    wf.setnchannels(1)
+    wf.setsampwidth(2)  # 16-bit PCM
+    wf.setframerate(sr)
+    return wf
+
+
+def pcm_frames(samples: Sequence[float]) -> bytes:
+    pcm = array("h", [int(max(-1.0, min(1.0, s)) * 32767) for s in samples])
+    if sys.byteorder == "big":
+        pcm.byteswap()  # WAV frames are little-endian
+    return pcm.tobytes()
+
+
+def harp_note_frames(freq: float, duration: float, sr: int) -> bytes:
+    return pcm_frames(harp_note(freq, duration, sr))
+
+
+# Distinct audio worth spreading across processes; below this, starting
+# the pool costs more than the synthesis it saves.
+PARALLEL_MIN_SECONDS = 10.0
+
+
+def render_voices(freqs: list[float], duration: float, sr: int) -> dict[float, bytes]:
+    """
+    PCM frames for each distinct pitch. Large chords render across processes
+    (threads would serialize on the GIL); workers reseed so forked processes
+    don't share one noise stream.
+    """
+    unique = list(dict.fromkeys(freqs))
+    workers = min(os.cpu_count() or 1, len(unique))
+    if workers < 2 or len(unique) * duration < PARALLEL_MIN_SECONDS:
+        return {freq: harp_note_frames(freq, duration, sr) for freq in unique}
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as pool:
+        return dict(zip(unique, pool.map(harp_note_frames, unique, repeat(duration), repeat(sr))))
 
 
 # -----------------------
@@ -164,31 +222,20 @@ def main():
     note_dur = 60.0 / bpm  # quarter-note
     gap = note_dur * 0.06  # small separation between plucks
 
-    song: list[float] = []
-
-    for note in notes:
-        f = note_to_freq(note)
-
-        # core pluck (harp rings longer and cleaner)
-        core = karplus_strong_harp(
-            f, duration=max(0.25, note_dur - gap), sr=sr,
-            decay=0.9988, damping=0.35
-        )
-
-        # soundboard bloom: resonances (tweak these for taste)
-        r1 = resonator(core, sr, f0=220.0, q=2.2, gain=0.25)
-        r2 = resonator(core, sr, f0=520.0, q=2.0, gain=0.18)
-
-        note_out = mix(core, mix(r1, r2, 1.0, 1.0), scale_a=0.88, scale_b=0.55)
-
-        song.extend(note_out)
-        song.extend(silence(gap, sr))
+    pluck_dur = max(0.25, note_dur - gap)
+    freqs = [note_to_freq(note) for note in notes]
+    voices = render_voices(freqs, pluck_dur, sr)
+    gap_frames = silence_frames(gap, sr)
 
     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
         path = f.name
 
     try:
-        write_wav(song, sr, path)
+        # Stream the rendered notes into the WAV; no full-song buffer.
+        with open_wav(path, sr) as wf:
+            for freq in freqs:
+                wf.writeframes(voices[freq])
+                wf.writeframes(gap_frames)
         subprocess.run(["afplay", path], check=False)
     finally:
         try:
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 
+import hashlib
 import math
 import os
-import struct
 import subprocess
 import sys
 import tempfile
+import time
 import wave
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO
 
 
 # -----------------------
@@ -24,6 +29,8 @@ NOTE_OFFSETS = {
 }
 
 
+# A phrase only ever names a handful of distinct notes; parse each once.
+@lru_cache(maxsize=None)
 def note_to_freq(note: str) -> float:
     note = note.strip()
     if len(note) < 2:
@@ -55,49 +62,146 @@ def note_to_freq(note: str) -> float:
 def synth_piano(freq: float, duration: float, sr: int) -> list[float]:
     n_samples = int(duration * sr)
 
-    # crude piano-ish harmonic spectrum
-    harmonics = [
-        (1, 1.00),
-        (2, 0.60),
-        (3, 0.40),
-        (4, 0.25),
-        (5, 0.15),
-        (6, 0.08),
-    ]
-
-    samples = []
-    for i in range(n_samples):
-        t = i / sr
+    # crude piano-ish harmonic spectrum: amplitudes of harmonics 1..6
+    a1, a2, a3, a4, a5, a6 = 1.00, 0.60, 0.40, 0.25, 0.15, 0.08
 
-        # envelope: fast attack + exponential decay
-        attack = 1.0 - math.exp(-t * 60.0)
-        decay = math.exp(-t * 3.0)
-        env = attack * decay
+    # Only the fundamental needs trig: the higher harmonics follow from
+    # sin((k+1)x) = 2cos(x)sin(kx) - sin((k-1)x).
+    sin = math.sin
+    cos = math.cos
+    w = 2.0 * math.pi * freq / sr
 
-        s = 0.0
-        for n, amp in harmonics:
-            s += amp * math.sin(2.0 * math.pi * (freq * n) * t)
+    # envelope: fast attack + exponential decay. exp(-k*i/sr) is the i-th
+    # power of a per-sample ratio, so both curves are running products.
+    attack_step = math.exp(-60.0 / sr)
+    decay_step = math.exp(-3.0 / sr)
+    attack = decay = 1.0
 
-        samples.append(s * env)
+    # One pass builds the enveloped samples and tracks the peak.
+    samples = [0.0] * n_samples
+    peak = 0.0
+    for i in range(n_samples):
+        x = w * i
+        s1 = sin(x)
+        c = 2.0 * cos(x)
+        s2 = c * s1
+        s3 = c * s2 - s1
+        s4 = c * s3 - s2
+        s5 = c * s4 - s3
+        s6 = c * s5 - s4
+        s = (a1 * s1 + a2 * s2 + a3 * s3 + a4 * s4 + a5 * s5 + a6 * s6) * ((1.0 - attack) * decay)
+        samples[i] = s
+        if s > peak:
+            peak = s
+        elif -s > peak:
+            peak = -s
+        attack *= attack_step
+        decay *= decay_step
 
     # normalize
-    peak = max(abs(x) for x in samples) or 1.0
+    peak = peak or 1.0
     return [x / peak for x in samples]
 
 
-def synth_silence(duration: float, sr: int) -> list[float]:
-    return [0.0] * int(duration * sr)
+def silence_frames(duration: float, sr: int) -> bytes:
+    # 16-bit zeros straight as bytes; no per-sample float list.
+    return bytes(2 * int(duration * sr))
+
 
+def open_wav(path: str | BinaryIO, sr: int) -> wave.Wave_write:
+    wf = wave.open(path, "w")
+    wf.setnchannels(1)
+    wf.setsampwidth(2)  # 16-bit PCM
+    wf.setframerate(sr)
+    return wf
 
-def write_wav(samples: list[float], sr: int, path: str) -> None:
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit PCM
-        wf.setframerate(sr)
 
-        for s in samples:
-            s = max(-1.0, min(1.0, s))
-            wf.writeframes(struct.pack("<h", int(s * 32767)))
+def pcm_frames(samples: list[float]) -> bytes:
+    pcm = array("h", [int(max(-1.0, min(1.0, s)) * 32767) for s in samples])
+    if sys.byteorder == "big":
+        pcm.byteswap()  # WAV frames are little-endian
+    return pcm.tobytes()
+
+
+# -----------------------
+# Note cache (~/.cache)
+# -----------------------
+
+# Bump when synth_piano's output changes so stale notes on disk are ignored.
+NOTE_CACHE_VERSION = 1
+NOTE_CACHE_LIMIT = 64 * 1024 * 1024
+# Temp files older than this were left by a writer that died mid-store.
+NOTE_CACHE_TMP_AGE = 60 * 60
+
+
+def note_cache_path(freq: float, duration: float, sr: int) -> str:
+    # Kept apart from music.py's tones/ directory so each pruner only
+    # trims its own files. Path.home() raises RuntimeError without a home.
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    key = f"v{NOTE_CACHE_VERSION}:{freq!r}:{duration!r}:{sr}"
+    name = hashlib.sha1(key.encode()).hexdigest() + ".pcm"
+    return os.path.join(base, "jpeckenpaugh", "play_notes", name)
+
+
+def load_cached_note(path: str, n_samples: int) -> bytes | None:
+    # Truncated or foreign files count as misses.
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if len(raw) != 2 * n_samples:
+            return None
+        os.utime(path)
+    except OSError:
+        return None
+    return raw
+
+
+def store_cached_note(path: str, frames: bytes) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(frames)
+        os.replace(tmp_path, path)
+        prune_note_cache(os.path.dirname(path))
+    except OSError:
+        pass
+
+
+# Trimmed once per run (on the first write), least recently used first.
+@lru_cache(maxsize=None)
+def prune_note_cache(cache_dir: str) -> None:
+    entries = []
+    total = 0
+    stale = time.time() - NOTE_CACHE_TMP_AGE
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pcm"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        elif entry.name.endswith(".tmp") and entry.stat().st_mtime < stale:
+            os.unlink(entry.path)
+    for _, size, entry_path in sorted(entries):
+        if total <= NOTE_CACHE_LIMIT:
+            break
+        os.unlink(entry_path)
+        total -= size
+
+
+# Phrases repeat pitches, so each (freq, duration) is synthesized once per
+# run, and once per machine via the PCM files under ~/.cache.
+@lru_cache(maxsize=256)
+def piano_note_frames(freq: float, duration: float, sr: int) -> bytes:
+    try:
+        path = note_cache_path(freq, duration, sr)
+    except RuntimeError:
+        # No home directory to cache under.
+        return pcm_frames(synth_piano(freq, duration, sr))
+    frames = load_cached_note(path, int(duration * sr))
+    if frames is None:
+        frames = pcm_frames(synth_piano(freq, duration, sr))
+        store_cached_note(path, frames)
+    return frames
 
 
 # -----------------------
@@ -122,27 +226,38 @@ def main():
         raise SystemExit("No notes provided.")
 
     sr = 44100
-    song = []
-
-    for note in notes:
-        freq = note_to_freq(note)
-        song.extend(synth_piano(freq, duration=note_dur - gap_dur, sr=sr))
-        song.extend(synth_silence(gap_dur, sr=sr))
+    freqs = [note_to_freq(note) for note in notes]
+    note_frames = int((note_dur - gap_dur) * sr)
+    gap_frames = silence_frames(gap_dur, sr)
 
     # write temp WAV and play with afplay
     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
         wav_path = f.name
 
+    player = None
     try:
-        write_wav(song, sr=sr, path=wav_path)
-        subprocess.run(["afplay", wav_path], check=False)
+        # Stream each note into the WAV. The header is sized up front, so
+        # afplay starts on the first note while the rest are synthesized.
+        # writeframesraw leaves that header alone; writeframes would patch it
+        # down to the bytes written so far after every chunk.
+        with open(wav_path, "wb") as fh, open_wav(fh, sr) as wf:
+            wf.setnframes(len(freqs) * (note_frames + len(gap_frames) // 2))
+            for freq in freqs:
+                wf.writeframesraw(piano_note_frames(freq, note_dur - gap_dur, sr))
+                wf.writeframesraw(gap_frames)
+                fh.flush()
+                if player is None:
+                    player = subprocess.Popen(["afplay", wav_path])
+        if player is not None:
+            player.wait()
     finally:
+        if player is not None and player.poll() is None:
+            player.kill()
         try:
             os.unlink(wav_path)
         except OSError:
             pass
 
-
 if __name__ == "__main__":
     main()
 
@@ -12,12 +12,18 @@ WEB_MODE = os.environ.get("LOKARTA_WEB") == "1"
 if os.name != 'nt' and not WEB_MODE:
     import termios
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.bootstrap import create_app
 from app.config import DATA_DIR
 from app.loop import (
     apply_router_command,
     animate_life_boost_gain,
     animate_strength_gain,
+    frame_from_state,
     handle_battle_end,
     handle_offensive_action,
     map_input_to_command,
@@ -78,10 +84,20 @@ def _preflight_error_lines(title: str, errors: list[dict], footer: str) -> list[
     return lines
 
 
+def _load_data_file(path: str) -> object:
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def run_data_preflight(render_frame_fn, read_keypress_fn) -> bool:
     if not os.path.isdir(DATA_DIR):
         return True
-    files = [name for name in sorted(os.listdir(DATA_DIR)) if name.endswith(".json")]
+    with os.scandir(DATA_DIR) as entries:
+        paths = {entry.name: entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()}
+    files = sorted(paths)
     total = max(1, len(files))
     results = []
     start = time.time()
@@ -150,35 +166,31 @@ def run_data_preflight(render_frame_fn, read_keypress_fn) -> bool:
                 errors.append(f"{key}: payload must be an object")
         return errors
 
-    objectives_payload = {}
-    events_payload = {}
-    spell_effects_payload = {}
-    if "quest_objectives.json" in files:
-        try:
-            with open(os.path.join(DATA_DIR, "quest_objectives.json"), "r", encoding="utf-8") as f:
-                objectives_payload = json.load(f)
-        except (OSError, JSONDecodeError):
-            objectives_payload = {}
-    if "quest_events.json" in files:
-        try:
-            with open(os.path.join(DATA_DIR, "quest_events.json"), "r", encoding="utf-8") as f:
-                events_payload = json.load(f)
-        except (OSError, JSONDecodeError):
-            events_payload = {}
-    if "spell_effects.json" in files:
+    # Each file is parsed once; the cross-file payloads are reused by the scan.
+    parsed: dict[str, object] = {}
+
+    def _parsed(name: str) -> object:
+        if name not in parsed:
+            parsed[name] = _load_data_file(paths[name])
+        return parsed[name]
+
+    def _dependency_payload(name: str) -> object:
+        if name not in paths:
+            return {}
         try:
-            with open(os.path.join(DATA_DIR, "spell_effects.json"), "r", encoding="utf-8") as f:
-                spell_effects_payload = json.load(f)
+            return _parsed(name)
         except (OSError, JSONDecodeError):
-            spell_effects_payload = {}
+            return {}
+
+    objectives_payload = _dependency_payload("quest_objectives.json")
+    events_payload = _dependency_payload("quest_events.json")
+    spell_effects_payload = _dependency_payload("spell_effects.json")
     for idx, name in enumerate(files):
-        path = os.path.join(DATA_DIR, name)
         ok = True
         count = 0
         error = ""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _parsed(name)
             if isinstance(data, dict):
                 count = len(data)
             elif isinstance(data, list):
@@ -358,9 +370,10 @@ def main():
     if os.name != 'nt' and not WEB_MODE:
         termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
 
+    # has_save is refreshed when entering the title (here, on QUIT) and by the
+    # title commands that create or delete slots, not on every frame.
+    state.player.has_save = SAVE_DATA.exists()
     while True:
-        if state.title_mode:
-            state.player.has_save = SAVE_DATA.exists()
         if state.inventory_mode:
             state.inventory_items = state.player.list_inventory_items(ITEMS)
         render_frame_state(APP, render_frame, state, generate_frame)
@@ -387,44 +400,7 @@ def main():
                     sys.stdout.flush()
                 return
             pre_location = state.player.location
-            pre_frame = generate_frame(
-                APP.screen_ctx,
-                state.player,
-                state.opponents,
-                state.last_message,
-                state.leveling_mode,
-                state.shop_mode,
-                state.shop_view,
-                state.inventory_mode,
-                state.inventory_items,
-                state.hall_mode,
-                state.hall_view,
-                state.inn_mode,
-                state.stats_mode,
-                state.followers_mode,
-                state.spell_mode,
-                state.element_mode,
-                state.alchemist_mode,
-                state.alchemy_first,
-                state.alchemy_selecting,
-                state.temple_mode,
-                state.smithy_mode,
-                state.portal_mode,
-                state.quest_mode,
-                state.title_menu_stack,
-                state.options_mode,
-                state.action_cursor,
-                state.menu_cursor,
-                state.followers_focus,
-                state.followers_action_cursor,
-                state.spell_cast_rank,
-                state.spell_target_mode,
-                state.spell_target_cursor,
-                state.spell_target_command,
-                state.quest_continent_index,
-                state.level_cursor,
-                state.level_up_notes,
-            )
+            pre_frame = frame_from_state(APP, state, generate_frame, state.last_message)
             state.title_mode = True
             state.player.location = "Title"
             state.player.title_confirm = False
@@ -484,44 +460,7 @@ def main():
             state.quest_continent_index = 0
             state.quest_detail_id = None
             state.quest_detail_page = 0
-            post_frame = generate_frame(
-                APP.screen_ctx,
-                state.player,
-                state.opponents,
-                state.last_message,
-                state.leveling_mode,
-                state.shop_mode,
-                state.shop_view,
-                state.inventory_mode,
-                state.inventory_items,
-                state.hall_mode,
-                state.hall_view,
-                state.inn_mode,
-                state.stats_mode,
-                state.followers_mode,
-                state.spell_mode,
-                state.element_mode,
-                state.alchemist_mode,
-                state.alchemy_first,
-                state.alchemy_selecting,
-                state.temple_mode,
-                state.smithy_mode,
-                state.portal_mode,
-                state.quest_mode,
-                state.title_menu_stack,
-                state.options_mode,
-                state.action_cursor,
-                state.menu_cursor,
-                state.followers_focus,
-                state.followers_action_cursor,
-                state.spell_cast_rank,
-                state.spell_target_mode,
-                state.spell_target_cursor,
-                state.spell_target_command,
-                state.quest_continent_index,
-                state.level_cursor,
-                state.level_up_notes,
-            )
+            post_frame = frame_from_state(APP, state, generate_frame, state.last_message)
             animate_art_transition(pre_frame, post_frame, state.player, pause_ticks=2)
             continue
 
@@ -569,7 +508,7 @@ def main():
         if cmd == "X_KEY":
             continue
 
-        pre_snapshot = None
+        pre_state = None
         if (
             cmd in ("ENTER_VENUE", "ENTER_SCENE")
             or cmd.startswith("TITLE_")
@@ -584,46 +523,12 @@ def main():
                 or state.portal_mode
             ))
         ):
-            pre_snapshot = {
-                "player": copy.deepcopy(state.player),
-                "opponents": copy.deepcopy(state.opponents),
-                "message": state.last_message,
-                "leveling_mode": state.leveling_mode,
-                "shop_mode": state.shop_mode,
-                "shop_view": state.shop_view,
-                "inventory_mode": state.inventory_mode,
-                "inventory_items": list(state.inventory_items),
-                "hall_mode": state.hall_mode,
-                "hall_view": state.hall_view,
-                "inn_mode": state.inn_mode,
-                "stats_mode": state.stats_mode,
-                "followers_mode": state.followers_mode,
-                "spell_mode": state.spell_mode,
-                "element_mode": state.element_mode,
-                "alchemist_mode": state.alchemist_mode,
-                "alchemy_first": state.alchemy_first,
-                "alchemy_selecting": state.alchemy_selecting,
-                "temple_mode": state.temple_mode,
-                "smithy_mode": state.smithy_mode,
-                "portal_mode": state.portal_mode,
-                "quest_mode": state.quest_mode,
-                "quest_detail_mode": state.quest_detail_mode,
-                "options_mode": state.options_mode,
-                "action_cursor": state.action_cursor,
-                "menu_cursor": state.menu_cursor,
-                "followers_focus": state.followers_focus,
-                "followers_action_cursor": state.followers_action_cursor,
-                "spell_cast_rank": state.spell_cast_rank,
-                "spell_target_mode": state.spell_target_mode,
-                "spell_target_cursor": state.spell_target_cursor,
-                "spell_target_command": state.spell_target_command,
-                "quest_continent_index": state.quest_continent_index,
-                "quest_detail_id": state.quest_detail_id,
-                "quest_detail_page": state.quest_detail_page,
-                "level_cursor": state.level_cursor,
-                "level_up_notes": list(state.level_up_notes),
-                "title_menu_stack": list(state.title_menu_stack),
-            }
+            pre_state = copy.copy(state)
+            pre_state.player = state.player.snapshot()
+            pre_state.opponents = [opp.snapshot() for opp in state.opponents]
+            pre_state.inventory_items = list(state.inventory_items)
+            pre_state.level_up_notes = list(state.level_up_notes)
+            pre_state.title_menu_stack = list(state.title_menu_stack)
             pre_in_venue = (
                 state.shop_mode
                 or state.hall_mode
@@ -643,7 +548,7 @@ def main():
             command_meta,
             action_cmd,
         )
-        if pre_snapshot is not None:
+        if pre_state is not None:
             post_in_venue = (
                 state.shop_mode
                 or state.hall_mode
@@ -655,88 +560,8 @@ def main():
             )
             post_location = state.player.location
             if pre_in_venue != post_in_venue or pre_location != post_location:
-                pre_frame = generate_frame(
-                    APP.screen_ctx,
-                    pre_snapshot["player"],
-                    pre_snapshot["opponents"],
-                    pre_snapshot["message"],
-                    pre_snapshot["leveling_mode"],
-                    pre_snapshot["shop_mode"],
-                    pre_snapshot.get("shop_view", "menu"),
-                    pre_snapshot["inventory_mode"],
-                    pre_snapshot["inventory_items"],
-                    pre_snapshot["hall_mode"],
-                    pre_snapshot["hall_view"],
-                    pre_snapshot["inn_mode"],
-                    pre_snapshot.get("stats_mode", False),
-                    pre_snapshot.get("followers_mode", False),
-                    pre_snapshot["spell_mode"],
-                    pre_snapshot.get("element_mode", False),
-                    pre_snapshot.get("alchemist_mode", False),
-                    pre_snapshot.get("alchemy_first", None),
-                    pre_snapshot.get("alchemy_selecting", False),
-                    pre_snapshot.get("temple_mode", False),
-                    pre_snapshot.get("smithy_mode", False),
-                    pre_snapshot.get("portal_mode", False),
-                    pre_snapshot.get("quest_mode", False),
-                    pre_snapshot.get("quest_detail_mode", False),
-                    pre_snapshot.get("title_menu_stack", []),
-                    pre_snapshot.get("options_mode", False),
-                    pre_snapshot.get("action_cursor", 0),
-                    pre_snapshot.get("menu_cursor", 0),
-                    pre_snapshot.get("followers_focus", "list"),
-                    pre_snapshot.get("followers_action_cursor", 0),
-                    pre_snapshot.get("spell_cast_rank", 1),
-                    pre_snapshot.get("spell_target_mode", False),
-                    pre_snapshot.get("spell_target_cursor", 0),
-                    pre_snapshot.get("spell_target_command", None),
-                    pre_snapshot.get("quest_continent_index", 0),
-                    pre_snapshot.get("quest_detail_id", None),
-                    pre_snapshot.get("quest_detail_page", 0),
-                    pre_snapshot.get("level_cursor", 0),
-                    pre_snapshot.get("level_up_notes", []),
-                )
-                post_frame = generate_frame(
-                    APP.screen_ctx,
-                    state.player,
-                    state.opponents,
-                    state.last_message,
-                    state.leveling_mode,
-                    state.shop_mode,
-                    state.shop_view,
-                    state.inventory_mode,
-                    state.inventory_items,
-                    state.hall_mode,
-                    state.hall_view,
-                    state.inn_mode,
-                    state.stats_mode,
-                    state.followers_mode,
-                    state.spell_mode,
-                    state.element_mode,
-                    state.alchemist_mode,
-                    state.alchemy_first,
-                    state.alchemy_selecting,
-                    state.temple_mode,
-                    state.smithy_mode,
-                    state.portal_mode,
-                    state.quest_mode,
-                    state.quest_detail_mode,
-                    state.title_menu_stack,
-                    state.options_mode,
-                    state.action_cursor,
-                    state.menu_cursor,
-                    state.followers_focus,
-                    state.followers_action_cursor,
-                    state.spell_cast_rank,
-                    state.spell_target_mode,
-                    state.spell_target_cursor,
-                    state.spell_target_command,
-                    state.quest_continent_index,
-                    state.quest_detail_id,
-                    state.quest_detail_page,
-                    state.level_cursor,
-                    state.level_up_notes,
-                )
+                pre_frame = frame_from_state(APP, pre_state, generate_frame, pre_state.last_message)
+                post_frame = frame_from_state(APP, state, generate_frame, state.last_message)
                 if cmd and cmd.startswith("PORTAL:"):
                     animate_portal_departure(pre_frame, post_frame, state.player, pause_ticks=1)
                 else:
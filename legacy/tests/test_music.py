@@ -0,0 +1,146 @@
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from array import array
+from unittest import mock
+
+import music
+
+
+class AfplayStreamingTests(unittest.TestCase):
+    def test_header_holds_full_length_when_playback_starts(self):
+        chunks = [array("h", [1] * 100), array("h", [2] * 50), array("h", [3] * 25)]
+        seen = {}
+        copy = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        copy.close()
+        self.addCleanup(os.unlink, copy.name)
+
+        class FakePlayer:
+            def __init__(self, cmd):
+                with open(cmd[-1], "rb") as handle:
+                    header = handle.read(44)
+                seen["data_size"] = struct.unpack("<I", header[40:44])[0]
+                seen["file_size"] = os.path.getsize(cmd[-1])
+                self.path = cmd[-1]
+
+            def wait(self):
+                with open(self.path, "rb") as src, open(copy.name, "wb") as dst:
+                    dst.write(src.read())
+
+            def poll(self):
+                return 0
+
+        with mock.patch("subprocess.Popen", FakePlayer):
+            music._afplay(iter(chunks), 175)
+
+        self.assertEqual(seen["data_size"], 350)
+        self.assertEqual(seen["file_size"], 44 + 200)
+        with wave.open(copy.name, "rb") as wav:
+            self.assertEqual(wav.getnframes(), 175)
+            expected = b"".join(chunk.tobytes() for chunk in chunks)
+            self.assertEqual(wav.readframes(175), expected)
+
+
+class RenderStepsTests(unittest.TestCase):
+    def setUp(self):
+        sequence = {"tempo": 120, "wave": "sine", "notes": [[1, 1], [5, 1]]}
+        self.data = {
+            "sequences": {"a": sequence},
+            "songs": {"loop": {"repeat": 3, "steps": [{"sequence": "a", "root": "C4"}]}},
+        }
+
+    def test_repeated_steps_render_once(self):
+        with mock.patch.object(music, "_render_step", wraps=music._render_step) as render:
+            chunks = list(music.iter_song(self.data, "loop", None, None, parallel=True))
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(chunks[0] == chunks[1] == chunks[2])
+
+    def test_random_split_renders_every_pass(self):
+        self.data["sequences"]["a"]["octave_split"] = "random"
+        with mock.patch.object(music, "_render_step", wraps=music._render_step) as render:
+            list(music.iter_song(self.data, "loop", None, None))
+        self.assertEqual(render.call_count, 3)
+
+    def test_small_song_skips_process_pool(self):
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            music.render_song(self.data, "loop", None, None, parallel=True)
+        pool.assert_not_called()
+
+
+class ToneCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmpdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for cached in (music._cached_tone, music._prune_tone_cache):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+        self.args = (440.0, 0.25, "sine")
+        self.path = music._tone_cache_path(*self.args)
+        self.expected = music.render_wave(*self.args)
+
+    def test_miss_renders_and_stores(self):
+        self.assertFalse(self.path.exists())
+        self.assertEqual(music._cached_tone(*self.args), self.expected)
+        self.assertEqual(self.path.read_bytes(), self.expected.tobytes())
+
+    def test_hit_reads_file_without_rendering(self):
+        stored = array("h", [7] * len(self.expected))
+        self.path.parent.mkdir(parents=True)
+        self.path.write_bytes(stored.tobytes())
+        with mock.patch.object(music, "render_wave") as render:
+            self.assertEqual(music._cached_tone(*self.args), stored)
+        render.assert_not_called()
+
+    def test_odd_length_file_is_rerendered(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_bytes(b"\x01\x02\x03")
+        self.assertEqual(music._cached_tone(*self.args), self.expected)
+        self.assertEqual(self.path.read_bytes(), self.expected.tobytes())
+
+    def test_short_file_is_rerendered(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_bytes(self.expected[: len(self.expected) // 2].tobytes())
+        self.assertEqual(music._cached_tone(*self.args), self.expected)
+
+    def test_truncated_tone_keeps_sequence_length(self):
+        sequence = {"tempo": 120, "wave": "sine", "notes": [[1, 1], [3, 1], [5, 1]]}
+        expected = music.render_sequence(sequence, 60, {})
+        music._cached_tone.cache_clear()
+        for path in self.path.parent.glob("*.pcm"):
+            path.write_bytes(path.read_bytes()[:1000])
+        self.assertEqual(music.render_sequence(sequence, 60, {}), expected)
+
+    def test_prune_drops_least_recently_used(self):
+        cache_dir = self.path.parent
+        cache_dir.mkdir(parents=True)
+        for index in range(3):
+            entry = cache_dir / f"old{index}.pcm"
+            entry.write_bytes(bytes(1000))
+            os.utime(entry, (index, index))
+        with mock.patch.object(music, "TONE_CACHE_LIMIT", 2500 + len(self.expected) * 2):
+            music._cached_tone(*self.args)
+        self.assertFalse((cache_dir / "old0.pcm").exists())
+        self.assertTrue((cache_dir / "old1.pcm").exists())
+        self.assertTrue(self.path.exists())
+
+    def test_prune_drops_stale_temp_files(self):
+        cache_dir = self.path.parent
+        cache_dir.mkdir(parents=True)
+        stale = cache_dir / "abc.123.tmp"
+        fresh = cache_dir / "def.456.tmp"
+        for entry in (stale, fresh):
+            entry.write_bytes(bytes(10))
+        os.utime(stale, (0, 0))
+        music._cached_tone(*self.args)
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()